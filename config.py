@@ -46,11 +46,16 @@ elif OPENROUTER_API_KEY:
 
 # Model configuration: Use only Groq's llama3-8b-8192 for all LLM calls (fastest, most reliable, least hallucination among free models)
 GROQ_MODEL = "llama3-8b-8192"
+# Lighter model tier for routine candidate-info prompts (name, contact, experience, position, location).
+# Technical question generation and farewell summaries keep GROQ_MODEL. Override via environment variable.
+GROQ_LIGHT_MODEL = os.getenv("GROQ_LIGHT_MODEL", GROQ_MODEL)
 
 # Conversation settings
 MAX_TECHNICAL_QUESTIONS = 5
 MIN_TECHNICAL_QUESTIONS = 3
 MAX_HISTORY_LENGTH = 10  # Number of conversation turns to maintain context
+# Set to "false" to answer deterministic stage transitions with canned English templates instead of an LLM call
+USE_LLM_FOR_TRANSITIONS = os.getenv("USE_LLM_FOR_TRANSITIONS", "true").lower() != "false"
 
 # Tech stack categories
 TECH_CATEGORIES = {
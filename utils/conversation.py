@@ -1,22 +1,97 @@
 """Manages conversation flow for TalentScout Hiring Assistant."""
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 import uuid
 import re
+import hashlib
+import logging
+import threading
 import time
-import json
 
 from utils.prompt_manager import PromptManager
 from utils.data_handler import DataHandler
 from utils.llm_router import LLMRouter
-from utils.sentiment_analyzer import SentimentAnalyzer
-from utils.language_manager import LanguageManager
-from utils.personalization_manager import PersonalizationManager
-from utils.performance_manager import PerformanceManager
-from utils.tech_questions import TechQuestionGenerator
 
 # Import config here to avoid circular imports
 import config
 
+logger = logging.getLogger(__name__)
+
+# Word tokenizer shared by the tech stack matchers
+_WORD_RE = re.compile(r"\w+")
+
+# Additional common technologies not in config
+_ADDITIONAL_TECHS = [
+    'HTML', 'CSS', 'SASS', 'SCSS', 'TypeScript', 'GraphQL', 'REST API',
+    'Microservices', 'Agile', 'Scrum', 'TDD', 'CI/CD', 'DevOps',
+    'Machine Learning', 'Deep Learning', 'AI', 'Blockchain'
+]
+
+# Common variations and abbreviations
+_TECH_VARIATIONS = {
+    'js': 'JavaScript',
+    'ts': 'TypeScript',
+    'py': 'Python',
+    'react.js': 'React',
+    'vue.js': 'Vue.js',
+    'node.js': 'Node.js',
+    'express.js': 'Express.js'
+}
+
+def _compile_tech_matchers(entries) -> Tuple[Tuple[str, Optional[str], Optional[re.Pattern]], ...]:
+    """
+    Precompile whole-word matchers for (lowercase term, technology) pairs.
+    
+    Single-word terms are matched by a set lookup against the message's word tokens,
+    which is equivalent to a \\b...\\b search. Terms containing spaces or punctuation
+    (e.g. "c++", "vue.js", "ruby on rails") keep a compiled regex.
+    
+    Args:
+        entries: Iterable of (lowercase term, technology name) pairs
+        
+    Returns:
+        Tuple of (technology, token, pattern) triples, with exactly one of token/pattern set
+    """
+    matchers = []
+    for term, tech in entries:
+        if _WORD_RE.fullmatch(term):
+            matchers.append((tech, term, None))
+        else:
+            matchers.append((tech, None, re.compile(rf'\b{re.escape(term)}\b')))
+    return tuple(matchers)
+
+# Language-specific "my name is ..." patterns, tried in order
+_NAME_PATTERNS = {
+    language: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for language, patterns in {
+        "en": [
+            r"my name is\s+([A-Za-z\s\-'\.]+)",
+            r"i am\s+([A-Za-z\s\-'\.]+)",
+            r"i'm\s+([A-Za-z\s\-'\.]+)",
+            r"call me\s+([A-Za-z\s\-'\.]+)"
+        ],
+        "es": [
+            r"mi nombre es\s+([A-Za-z\s\-'\.]+)",
+            r"me llamo\s+([A-Za-z\s\-'\.]+)",
+            r"soy\s+([A-Za-z\s\-'\.]+)"
+        ],
+        "fr": [
+            r"je m'appelle\s+([A-Za-z\s\-'\.]+)",
+            r"mon nom est\s+([A-Za-z\s\-'\.]+)",
+            r"je suis\s+([A-Za-z\s\-'\.]+)"
+        ]
+    }.items()
+}
+_NAME_STRIP_RE = re.compile(r'[^\w\s\-\']')
+_NAME_FORMAT_RE = re.compile(r'^[A-Za-z\s\-\'\.]{2,50}$')
+
+# All known technologies, in reporting order
+_TECH_MATCHERS = _compile_tech_matchers(
+    (tech.lower(), tech)
+    for techs in (*config.TECH_CATEGORIES.values(), _ADDITIONAL_TECHS)
+    for tech in techs
+)
+_TECH_VARIATION_MATCHERS = _compile_tech_matchers(_TECH_VARIATIONS.items())
+
 class ConversationManager:
     """Manages conversation flow for the TalentScout Hiring Assistant."""
     
@@ -44,9 +119,31 @@ class ConversationManager:
         "tech_stack": ["tech_stack"],
     }
     
+    # The schema is fixed, so precompute per-stage field sets and the flat field list once
+    _REQUIRED_FIELD_SETS = tuple(frozenset(fields) for fields in REQUIRED_FIELDS.values())
+    _FLAT_REQUIRED = tuple(field for fields in REQUIRED_FIELDS.values() for field in fields)
+    
+    # Candidate summary schema: (field, default when not collected)
+    _SUMMARY_BASIC = (
+        ("name", "Not provided"),
+        ("email", "Not provided"),
+        ("phone", "Not provided"),
+        ("position", "Not provided"),
+        ("location", "Not provided"),
+        ("years_experience", "Not provided"),
+    )
+    _SUMMARY_TECHNICAL = ("tech_stack", "technical_questions", "technical_answers")
+    
     # Keywords that indicate the user wants to end the conversation
     EXIT_KEYWORDS = ["exit", "quit", "end interview", "stop", "bye", "goodbye"]
     
+    # Single-pass matcher for the exit keywords (substring match, like the keyword list)
+    EXIT_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in EXIT_KEYWORDS))
+    
+    # Services shared by every session (stateless or keyed by session/user), built once per process
+    _shared: Dict[str, Any] = {}
+    _shared_lock = threading.Lock()
+    
     def __init__(self, session_id: Optional[str] = None):
         """
         Initialize conversation manager.
@@ -55,16 +152,18 @@ class ConversationManager:
             session_id: Optional session ID (generated if not provided)
         """
         self.session_id = session_id or str(uuid.uuid4())
-        self.prompt_manager = PromptManager()
-        self.data_handler = DataHandler()
-        self.llm_router = LLMRouter()
-        self.sentiment_analyzer = SentimentAnalyzer()
-        
-        # Initialize new managers
-        self.language_manager = LanguageManager()
-        self.personalization_manager = PersonalizationManager()
-        self.performance_manager = PerformanceManager()
-        self.tech_question_generator = TechQuestionGenerator()
+        self.prompt_manager = self._get_shared("prompt_manager", PromptManager)
+        self.data_handler = self._get_shared("data_handler", DataHandler)
+        self.llm_router = self._get_shared("llm_router", LLMRouter)
+        
+        # Optional managers are imported and created on first access (see properties below).
+        # The sentiment analyzer keeps a per-session emotion history, so it is not shared.
+        self._sentiment_analyzer = None
+        self._sentiment_analysis_enabled: Optional[bool] = None
+        self._language_manager = None
+        self._personalization_manager = None
+        self._performance_manager = None
+        self._tech_question_generator = None
         
         # Load existing session or create new one
         self.candidate_data = self.data_handler.load_candidate_data(self.session_id) or {}
@@ -72,44 +171,120 @@ class ConversationManager:
         self.history: List[Dict[str, str]] = self.candidate_data.get("conversation_history", [])
         self.technical_questions: List[str] = []
         
-        # Track sentiment analysis status
-        self.sentiment_analysis_enabled = self.sentiment_analyzer.is_available()
-        if not self.sentiment_analysis_enabled:
-            logger.info("Sentiment analysis is not available. Using fallback mode.")
-        
         # Initialize user ID and language
         self.user_id = self.personalization_manager.get_user_id(self.session_id, self.candidate_data)
         self.current_language = self.candidate_data.get("language", "en")
         
-        # Preload common responses for performance
-        self.performance_manager.preload_common_responses()
-        
         # Load existing technical questions if available
         if "technical_questions" in self.candidate_data:
             self.technical_questions = self.candidate_data["technical_questions"]
     
+    @classmethod
+    def _get_shared(cls, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Get a process-wide shared service, creating it on first use.
+        
+        Args:
+            name: Registry key for the service
+            factory: Callable that builds the service
+            
+        Returns:
+            The shared service instance
+        """
+        service = cls._shared.get(name)
+        if service is None:
+            with cls._shared_lock:
+                service = cls._shared.get(name)
+                if service is None:
+                    service = cls._shared[name] = factory()
+        return service
+    
+    @property
+    def sentiment_analyzer(self):
+        """Sentiment analyzer, created on first use (it probes the HuggingFace API)."""
+        if self._sentiment_analyzer is None:
+            from utils.sentiment_analyzer import SentimentAnalyzer
+            self._sentiment_analyzer = SentimentAnalyzer()
+        return self._sentiment_analyzer
+    
+    @property
+    def sentiment_analysis_enabled(self) -> bool:
+        """Whether sentiment analysis is available, checked on first use."""
+        if self._sentiment_analysis_enabled is None:
+            self._sentiment_analysis_enabled = self.sentiment_analyzer.is_available()
+            if not self._sentiment_analysis_enabled:
+                logger.info("Sentiment analysis is not available. Using fallback mode.")
+        return self._sentiment_analysis_enabled
+    
+    @property
+    def language_manager(self):
+        """Language manager, created on first use."""
+        if self._language_manager is None:
+            from utils.language_manager import LanguageManager
+            self._language_manager = self._get_shared("language_manager", LanguageManager)
+        return self._language_manager
+    
+    @property
+    def personalization_manager(self):
+        """Personalization manager, created on first use."""
+        if self._personalization_manager is None:
+            from utils.personalization_manager import PersonalizationManager
+            self._personalization_manager = self._get_shared("personalization_manager", PersonalizationManager)
+        return self._personalization_manager
+    
+    @property
+    def performance_manager(self):
+        """Performance manager, created on first use."""
+        if self._performance_manager is None:
+            self._performance_manager = self._get_shared("performance_manager", self._create_performance_manager)
+        return self._performance_manager
+    
+    @staticmethod
+    def _create_performance_manager():
+        """Build the shared performance manager, preloading common responses once."""
+        from utils.performance_manager import PerformanceManager
+        performance_manager = PerformanceManager()
+        performance_manager.preload_common_responses()
+        return performance_manager
+    
+    @property
+    def tech_question_generator(self):
+        """Technical question generator, created on first use."""
+        if self._tech_question_generator is None:
+            from utils.tech_questions import TechQuestionGenerator
+            self._tech_question_generator = self._get_shared("tech_question_generator", TechQuestionGenerator)
+        return self._tech_question_generator
+    
     def _determine_current_stage(self) -> int:
         """Determine the current conversation stage based on collected data."""
-        if not self.candidate_data:
+        data = self.candidate_data
+        if not data:
             return self.STAGES["greeting"]
             
         # Check if conversation is already complete
-        if self.candidate_data.get("conversation_complete", False):
+        if data.get("conversation_complete", False):
             return self.STAGES["complete"]
             
-        # Check each stage's required fields
-        for stage_name, stage_index in self.STAGES.items():
-            if stage_name in self.REQUIRED_FIELDS:
-                required_fields = self.REQUIRED_FIELDS[stage_name]
-                if not all(field in self.candidate_data for field in required_fields):
-                    return stage_index
+        # Check each stage's required fields in conversation order
+        if "name" not in data:
+            return self.STAGES["name"]
+        if "email" not in data or "phone" not in data:
+            return self.STAGES["contact_info"]
+        if "years_experience" not in data:
+            return self.STAGES["experience"]
+        if "position" not in data:
+            return self.STAGES["position"]
+        if "location" not in data:
+            return self.STAGES["location"]
+        if "tech_stack" not in data:
+            return self.STAGES["tech_stack"]
         
         # If technical questions haven't been asked yet
-        if "technical_questions" not in self.candidate_data:
+        if "technical_questions" not in data:
             return self.STAGES["technical_questions"]
             
         # If we have technical questions but not all have been answered
-        if "technical_answers" not in self.candidate_data or len(self.candidate_data["technical_answers"]) < len(self.candidate_data["technical_questions"]):
+        if len(data.get("technical_answers", ())) < len(data["technical_questions"]):
             return self.STAGES["technical_questions"]
             
         # Default to farewell if everything else is complete
@@ -128,7 +303,7 @@ class ConversationManager:
         start_time = time.time()
         
         # Check for exit keywords
-        if any(keyword in user_message.lower() for keyword in self.EXIT_KEYWORDS):
+        if self.EXIT_PATTERN.search(user_message.lower()):
             return self._handle_exit()
         
         # Enhanced language detection and switching
@@ -260,31 +435,11 @@ class ConversationManager:
     
     def _extract_name(self, message: str) -> Optional[str]:
         """Extract name from message with improved patterns."""
-        # Language-specific patterns
-        name_patterns = {
-            "en": [
-                r"my name is\s+([A-Za-z\s\-'\.]+)",
-                r"i am\s+([A-Za-z\s\-'\.]+)",
-                r"i'm\s+([A-Za-z\s\-'\.]+)",
-                r"call me\s+([A-Za-z\s\-'\.]+)"
-            ],
-            "es": [
-                r"mi nombre es\s+([A-Za-z\s\-'\.]+)",
-                r"me llamo\s+([A-Za-z\s\-'\.]+)",
-                r"soy\s+([A-Za-z\s\-'\.]+)"
-            ],
-            "fr": [
-                r"je m'appelle\s+([A-Za-z\s\-'\.]+)",
-                r"mon nom est\s+([A-Za-z\s\-'\.]+)",
-                r"je suis\s+([A-Za-z\s\-'\.]+)"
-            ]
-        }
-        
-        patterns = name_patterns.get(self.current_language, name_patterns["en"])
+        patterns = _NAME_PATTERNS.get(self.current_language, _NAME_PATTERNS["en"])
         
         # Try pattern matching first
         for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+            match = pattern.search(message)
             if match:
                 name = match.group(1).strip()
                 if self._validate_name(name):
@@ -292,7 +447,7 @@ class ConversationManager:
         
         # Fallback: if message is short and looks like a name
         if len(message.split()) <= 4:
-            clean_name = re.sub(r'[^\w\s\-\']', '', message).strip()
+            clean_name = _NAME_STRIP_RE.sub('', message).strip()
             if self._validate_name(clean_name):
                 return clean_name
         
@@ -474,40 +629,19 @@ class ConversationManager:
     
     def _extract_tech_stack(self, message: str) -> Optional[List[str]]:
         """Extract tech stack with comprehensive matching."""
-        # Get all known technologies from config
-        all_technologies = []
-        for category, techs in config.TECH_CATEGORIES.items():
-            all_technologies.extend(techs)
-        
-        # Additional common technologies not in config
-        additional_techs = [
-            'HTML', 'CSS', 'SASS', 'SCSS', 'TypeScript', 'GraphQL', 'REST API',
-            'Microservices', 'Agile', 'Scrum', 'TDD', 'CI/CD', 'DevOps',
-            'Machine Learning', 'Deep Learning', 'AI', 'Blockchain'
-        ]
-        all_technologies.extend(additional_techs)
-        
-        found_technologies = []
         message_lower = message.lower()
+        # Tokenize once; single-word technologies become set lookups
+        tokens = set(_WORD_RE.findall(message_lower))
         
         # Look for exact matches (case-insensitive)
-        for tech in all_technologies:
-            if re.search(rf'\b{re.escape(tech.lower())}\b', message_lower):
-                found_technologies.append(tech)
+        found_technologies = [
+            tech for tech, token, pattern in _TECH_MATCHERS
+            if (token in tokens if pattern is None else pattern.search(message_lower))
+        ]
         
         # Look for common variations and abbreviations
-        tech_variations = {
-            'js': 'JavaScript',
-            'ts': 'TypeScript',
-            'py': 'Python',
-            'react.js': 'React',
-            'vue.js': 'Vue.js',
-            'node.js': 'Node.js',
-            'express.js': 'Express.js'
-        }
-        
-        for variation, full_name in tech_variations.items():
-            if re.search(rf'\b{re.escape(variation)}\b', message_lower):
+        for full_name, token, pattern in _TECH_VARIATION_MATCHERS:
+            if token in tokens if pattern is None else pattern.search(message_lower):
                 if full_name not in found_technologies:
                     found_technologies.append(full_name)
         
@@ -519,8 +653,7 @@ class ConversationManager:
             return False
         
         # Check for reasonable name pattern
-        name_pattern = r'^[A-Za-z\s\-\'\.]{2,50}$'
-        if not re.match(name_pattern, name):
+        if not _NAME_FORMAT_RE.match(name):
             return False
         
         # Should have 1-4 words
@@ -570,63 +703,6 @@ class ConversationManager:
         is_reasonable_length = 2 <= len(location.split()) <= 6  # Reasonable word count
         
         return has_location_indicator or has_comma_separation or is_reasonable_length
-        
-        # Name validation (2-4 alphabetic names)
-        if self.stage == self.STAGES["name"] and "name" not in self.candidate_data:
-            name_match = re.search(r"^\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*$", message)
-            if name_match:
-                self.candidate_data["name"] = name_match.group(1).strip()
-
-        # Extract phone if in contact info stage
-        if self.stage == self.STAGES["contact_info"] and "phone" not in self.candidate_data:
-            phone_match = re.search(r"\+?\d{1,4}?[-.\s]?\(?\d{1,3}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}", message)
-            if phone_match and len(phone_match.group()) >= 7:
-                self.candidate_data["phone"] = phone_match.group().strip()
-
-        # Extract years of experience
-        if self.stage == self.STAGES["experience"] and "years_experience" not in self.candidate_data:
-            experience_match = re.search(r"(\d+)(?:\s+years|\s+year|\s+yr|\s*\+\s*years|\s*\+)", message, re.IGNORECASE)
-            if experience_match:
-                try:
-                    self.candidate_data["years_experience"] = int(experience_match.group(1))
-                except ValueError:
-                    pass
-        
-        # Extract position
-        if self.stage == self.STAGES["position"] and "position" not in self.candidate_data:
-            # This is more complex, use the full message
-            # Validate position title
-            position_match = re.search(r"\b(senior|junior|lead|manager|director|developer|engineer)\b", 
-                message, re.IGNORECASE)
-            if position_match:
-                self.candidate_data["position"] = position_match.group(1).title()
-            else:
-                self.candidate_data["position"] = message.strip()
-        
-        # Extract location
-        if self.stage == self.STAGES["location"] and "location" not in self.candidate_data:
-            location_match = re.search(r"\b[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\b", message)
-            if location_match:
-                self.candidate_data["location"] = location_match.group().strip()
-        
-        # Extract tech stack
-        if self.stage == self.STAGES["tech_stack"] and "tech_stack" not in self.candidate_data:
-            # Parse tech stack from free text by checking against known technologies
-            tech_stack = []
-            all_technologies = []
-            
-            # Combine all technologies from the configuration
-            for category, techs in config.TECH_CATEGORIES.items():
-                all_technologies.extend(techs)
-            
-            # Look for matches in the message
-            for tech in all_technologies:
-                if re.search(r"\b" + re.escape(tech) + r"\b", message, re.IGNORECASE):
-                    tech_stack.append(tech)
-            
-            # If we found technologies, save them
-            if tech_stack:
-                self.candidate_data["tech_stack"] = tech_stack
     
     def _generate_response(self, user_message: str) -> str:
         """
@@ -727,6 +803,10 @@ class ConversationManager:
             # Name collected successfully, transition to next stage
             self.stage = self.STAGES["contact_info"]
             
+            template_reply = self._transition_reply("name->contact_info")
+            if template_reply:
+                return template_reply
+            
             # Use transition prompt for smooth flow
             transition_prompt = self.prompt_manager.get_prompt("transition",
                 completed_stage="name collection",
@@ -761,11 +841,7 @@ class ConversationManager:
                 )
         
         # Use enhanced LLM routing
-        context = {"conversation_history": self.history}
-        response = self.llm_router.get_multilingual_response(
-            combined_prompt, self.current_language, context, "name"
-        )
-        return response
+        return self._cached_llm(combined_prompt, "name")
     
     def _handle_contact_collection(self, user_message: str) -> str:
         """Handle the contact information collection stage with multilingual support."""
@@ -781,6 +857,9 @@ class ConversationManager:
         if "email" in self.candidate_data and "phone" in self.candidate_data:
             # Move to next stage
             self.stage = self.STAGES["experience"]
+            template_reply = self._transition_reply("contact_info->experience")
+            if template_reply:
+                return template_reply
             prompt = self.prompt_manager.get_prompt("candidate_info",
                 known_info=known_info,
                 next_info="years of experience in the industry"
@@ -799,11 +878,7 @@ class ConversationManager:
             )
         
         # Use multilingual LLM routing
-        context = {"conversation_history": self.history}
-        response = self.llm_router.get_multilingual_response(
-            prompt, self.current_language, context, "contact_info"
-        )
-        return response
+        return self._cached_llm(prompt, "contact_info")
     
     def _handle_experience_collection(self, user_message: str) -> str:
         """Handle the experience collection stage with multilingual support."""
@@ -815,6 +890,9 @@ class ConversationManager:
             # Move to next stage
             known_info += f"\nYears of Experience: {self.candidate_data['years_experience']}"
             self.stage = self.STAGES["position"]
+            template_reply = self._transition_reply("experience->position")
+            if template_reply:
+                return template_reply
             prompt = self.prompt_manager.get_prompt("candidate_info",
                 known_info=known_info,
                 next_info="desired position or role"
@@ -827,11 +905,7 @@ class ConversationManager:
             )
         
         # Use multilingual LLM routing
-        context = {"conversation_history": self.history}
-        response = self.llm_router.get_multilingual_response(
-            prompt, self.current_language, context, "experience"
-        )
-        return response
+        return self._cached_llm(prompt, "experience")
     
     def _handle_position_collection(self, user_message: str) -> str:
         """Handle the position collection stage."""
@@ -844,6 +918,9 @@ class ConversationManager:
             # Move to next stage
             known_info += f"\nDesired Position: {self.candidate_data['position']}"
             self.stage = self.STAGES["location"]
+            template_reply = self._transition_reply("position->location")
+            if template_reply:
+                return template_reply
             prompt = self.prompt_manager.get_prompt("candidate_info",
                 known_info=known_info,
                 next_info="current location"
@@ -855,8 +932,7 @@ class ConversationManager:
                 next_info="desired position or role"
             )
         
-        response = self.llm_router.get_response(prompt)
-        return response
+        return self._cached_llm(prompt)
     
     def _handle_location_collection(self, user_message: str) -> str:
         """Handle the location collection stage."""
@@ -870,6 +946,9 @@ class ConversationManager:
             # Move to next stage
             known_info += f"\nLocation: {self.candidate_data['location']}"
             self.stage = self.STAGES["tech_stack"]
+            template_reply = self._transition_reply("location->tech_stack")
+            if template_reply:
+                return template_reply
             prompt = self.prompt_manager.get_prompt("tech_stack", known_info=known_info)
         else:
             # Still need location info
@@ -878,7 +957,57 @@ class ConversationManager:
                 next_info="current location"
             )
         
-        response = self.llm_router.get_response(prompt)
+        return self._cached_llm(prompt)
+    
+    def _transition_reply(self, transition: str) -> Optional[str]:
+        """
+        Get a canned reply for a deterministic stage transition, skipping the LLM call.
+        
+        Args:
+            transition: Transition key such as "contact_info->experience"
+            
+        Returns:
+            Template reply, or None when the LLM should handle the transition
+        """
+        # Templates are English only; other languages still go through the LLM
+        if config.USE_LLM_FOR_TRANSITIONS or self.current_language != "en":
+            return None
+        
+        return self.prompt_manager.get_transition_message(transition, **self.candidate_data)
+    
+    def _cached_llm(self, prompt: str, use_case: str = "general") -> str:
+        """
+        Get an LLM response for a stage prompt, reusing cached responses for identical prompts.
+        
+        Only English responses are cached: for other languages the router adds a summary of
+        this session's conversation history to the prompt, so the reply is session-specific.
+        
+        Args:
+            prompt: Stage prompt built from the prompt manager
+            use_case: Use case for fallback responses
+            
+        Returns:
+            Response message in the current language
+        """
+        cacheable = self.current_language == "en"
+        if cacheable:
+            key_source = f"{self.current_language}:{use_case}:{prompt}"
+            cache_key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+            
+            cached_response = self.performance_manager.get_cached_response(cache_key)
+            if cached_response:
+                return cached_response
+        
+        # Candidate-info prompts are routine, so route them to the lighter model tier
+        context = {"conversation_history": self.history}
+        response = self.llm_router.get_multilingual_response(
+            prompt, self.current_language, context, use_case, model=config.GROQ_LIGHT_MODEL
+        )
+        
+        # Don't pin static fallbacks in the cache while the APIs are unavailable
+        if cacheable and not self.llm_router.is_fallback(response):
+            self.performance_manager.cache_response(cache_key, response)
+        
         return response
     
     def _handle_tech_stack_collection(self, user_message: str) -> str:
@@ -1023,20 +1152,16 @@ class ConversationManager:
         if not self.technical_questions and "technical_questions" in self.candidate_data:
             self.technical_questions = self.candidate_data["technical_questions"]
         
-        # Initialize technical answers if needed
-        if "technical_answers" not in self.candidate_data:
-            self.candidate_data["technical_answers"] = []
+        # Initialize technical answers if needed and store the answer to the current question
+        answers = self.candidate_data.setdefault("technical_answers", [])
+        answers.append(user_message)
         
-        # Store the answer to the current question
-        self.candidate_data["technical_answers"].append(user_message)
-        
-        # Check if we've asked all questions
-        current_question_idx = len(self.candidate_data["technical_answers"]) - 1
+        # Answers given so far; the next question (if any) has the same index
+        n_answered = len(answers)
         
         # If we have more questions
-        if current_question_idx < len(self.technical_questions) - 1:
-            next_question_idx = current_question_idx + 1
-            response = f"Thank you for your answer. Here's the next question:\n\n{self.technical_questions[next_question_idx]}"
+        if n_answered < len(self.technical_questions):
+            response = f"Thank you for your answer. Here's the next question:\n\n{self.technical_questions[n_answered]}"
         else:
             # All questions asked, move to farewell
             self.stage = self.STAGES["farewell"]
@@ -1070,8 +1195,9 @@ class ConversationManager:
         # Generate farewell response
         farewell = "Thank you for your time. The interview has been concluded. The TalentScout team will review your information and will be in touch if there's a match for your profile. Have a great day!"
         
-        # Save the final state
+        # Save the final state and wait for it to reach disk
         self._save_session()
+        self.data_handler.flush(self.session_id)
         
         return farewell
     
@@ -1089,7 +1215,7 @@ class ConversationManager:
         
         cached_questions = self.performance_manager.get_cached_response(cache_key)
         if cached_questions:
-            self.technical_questions = json.loads(cached_questions)
+            self.technical_questions = list(cached_questions)
         else:
             # Use the new TechQuestionGenerator to generate questions
             self.technical_questions = self.tech_question_generator.generate_questions(
@@ -1098,8 +1224,8 @@ class ConversationManager:
                 num_questions=None  # Use default from config
                 )
             
-            # Cache the questions
-            self.performance_manager.cache_response(cache_key, json.dumps(self.technical_questions))
+            # Cache the questions (the cache holds objects, so no serialization is needed)
+            self.performance_manager.cache_response(cache_key, tuple(self.technical_questions))
             
         # Store the questions in candidate data
         self.candidate_data["technical_questions"] = self.technical_questions
@@ -1120,15 +1246,16 @@ class ConversationManager:
             "content": message
         })
         
-        # Keep history within limits
-        if len(self.history) > config.MAX_HISTORY_LENGTH * 2:  # * 2 for pairs of messages
-            self.history = self.history[-config.MAX_HISTORY_LENGTH * 2:]
+        # Keep history within limits, trimming in place instead of copying the tail
+        history_limit = config.MAX_HISTORY_LENGTH * 2  # * 2 for pairs of messages
+        if len(self.history) > history_limit:
+            del self.history[:-history_limit]
         
         # Update history in candidate data
         self.candidate_data["conversation_history"] = self.history
     
     def _save_session(self) -> None:
-        """Save current session data."""
+        """Save current session data (written to disk by the data handler's background writer)."""
         self.data_handler.save_candidate_data(self.session_id, self.candidate_data)
     
     def get_conversation_history(self) -> List[Dict[str, str]]:
@@ -1143,9 +1270,6 @@ class ConversationManager:
         self.technical_questions = []
         self.current_language = "en"
         self._save_session()
-        
-        # Clear performance cache for this user
-        self.performance_manager.clear_cache()
 
     def get_conversation_analytics(self) -> Dict[str, Any]:
         """Get analytics about the current conversation."""
@@ -1174,63 +1298,43 @@ class ConversationManager:
     
     def _calculate_completion_percentage(self) -> float:
         """Calculate the completion percentage of the conversation."""
+        data = self.candidate_data
         total_stages = len(self.STAGES) - 2  # Exclude 'complete' and 'farewell'
-        completed_stages = 0
         
-        for stage_name, stage_index in self.STAGES.items():
-            if stage_name in ["complete", "farewell"]:
-                continue
-                
-            if stage_name in self.REQUIRED_FIELDS:
-                required_fields = self.REQUIRED_FIELDS[stage_name]
-                if all(field in self.candidate_data for field in required_fields):
-                    completed_stages += 1
-            elif stage_name == "technical_questions":
-                if "technical_questions" in self.candidate_data and "technical_answers" in self.candidate_data:
-                    if len(self.candidate_data["technical_answers"]) >= len(self.candidate_data["technical_questions"]):
-                        completed_stages += 1
+        # Stages with required fields are complete when all of them are present
+        keys = data.keys()
+        completed_stages = sum(1 for required_fields in self._REQUIRED_FIELD_SETS if keys >= required_fields)
+        
+        # The technical questions stage is complete once every question has an answer
+        if "technical_questions" in data and "technical_answers" in data:
+            if len(data["technical_answers"]) >= len(data["technical_questions"]):
+                completed_stages += 1
         
         return (completed_stages / total_stages) * 100
     
     def _get_missing_fields(self) -> List[str]:
         """Get list of missing required fields."""
-        missing_fields = []
-        
-        for stage_name, required_fields in self.REQUIRED_FIELDS.items():
-            for field in required_fields:
-                if field not in self.candidate_data:
-                    missing_fields.append(field)
-        
-        return missing_fields
+        data = self.candidate_data
+        return [field for field in self._FLAT_REQUIRED if field not in data]
     
     def get_candidate_summary(self) -> Dict[str, Any]:
         """Get a comprehensive summary of the candidate's information."""
+        data = self.candidate_data
         summary = {
             "session_id": self.session_id,
-            "basic_info": {
-                "name": self.candidate_data.get("name", "Not provided"),
-                "email": self.candidate_data.get("email", "Not provided"),
-                "phone": self.candidate_data.get("phone", "Not provided"),
-                "position": self.candidate_data.get("position", "Not provided"),
-                "location": self.candidate_data.get("location", "Not provided"),
-                "years_experience": self.candidate_data.get("years_experience", "Not provided"),
-            },
-            "technical_info": {
-                "tech_stack": self.candidate_data.get("tech_stack", []),
-                "technical_questions": self.candidate_data.get("technical_questions", []),
-                "technical_answers": self.candidate_data.get("technical_answers", []),
-            },
+            "basic_info": {field: data.get(field, default) for field, default in self._SUMMARY_BASIC},
+            "technical_info": {field: data.get(field, []) for field in self._SUMMARY_TECHNICAL},
             "conversation_meta": {
                 "language": self.current_language,
-                "conversation_complete": self.candidate_data.get("conversation_complete", False),
+                "conversation_complete": data.get("conversation_complete", False),
                 "total_messages": len(self.history),
                 "completion_percentage": self._calculate_completion_percentage(),
             }
         }
         
         # Add sentiment analysis if available
-        if "sentiment_analysis" in self.candidate_data:
-            summary["sentiment_analysis"] = self.candidate_data["sentiment_analysis"]
+        if "sentiment_analysis" in data:
+            summary["sentiment_analysis"] = data["sentiment_analysis"]
         
         return summary
     
@@ -1,21 +1,94 @@
 """Handles data processing and storage for TalentScout Hiring Assistant."""
+import atexit
+import hashlib
 import json
+import logging
+import math
 import os
-from typing import Dict, List, Any, Optional
+import queue
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Set, Tuple
 import datetime
 
+# orjson is optional: it is much faster than the stdlib encoder/decoder, but json works everywhere
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize candidate data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _add_timestamp(payload: bytes, data: Dict[str, Any], timestamp: str) -> bytes:
+    """Add a "timestamp" field to a record serialized by _dumps, reusing its bytes when possible."""
+    # Indented non-empty objects close with "\n}" in both encoders; anything else is serialized again
+    if payload.endswith(b"\n}"):
+        return b"%s,\n  \"timestamp\": %s\n}" % (payload[:-2], json.dumps(timestamp).encode("utf-8"))
+    return _dumps({**data, "timestamp": timestamp})
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes written by _dumps."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+logger = logging.getLogger(__name__)
+
+def _normalize_experience(value: Any) -> Any:
+    """Store numeric-string experience ("3", "2.5") as a number so readers don't re-parse it."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        years = float(value)
+    except ValueError:
+        return value
+    # "inf", "nan" and "1e400" parse as floats but are not experience values (and aren't valid JSON)
+    return years if math.isfinite(years) else value
+
 class DataHandler:
     """Manages candidate data storage and retrieval."""
     
-    def __init__(self, data_dir: str = "data"):
+    # Per-field normalization applied when records are saved or updated
+    _NORMALIZERS = {
+        "years_experience": _normalize_experience,
+    }
+    
+    def __init__(self, data_dir: str = "data", max_cached_sessions: int = 1000):
         """
         Initialize data handler.
         
         Args:
             data_dir: Directory for storing data files
+            max_cached_sessions: Maximum number of candidate records to keep in memory
         """
         self.data_dir = data_dir
+        self.max_cached_sessions = max_cached_sessions
         self._ensure_data_dir()
+        
+        # Decoded candidate records by session (least recently used first), and sessions with updates not yet on disk
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        # Fingerprint of the content (minus timestamp) last written for each session, with its timestamp
+        self._last_digest: Dict[str, Tuple[bytes, str]] = {}
+        self._lock = threading.RLock()
+        
+        # Serialized records waiting for the background writer: (session_id, file_path, payload, done)
+        self._write_queue: "queue.Queue[Tuple[str, str, bytes, threading.Event]]" = queue.Queue()
+        # Completion event of each session's most recently queued write (writes run in order)
+        self._pending: Dict[str, threading.Event] = {}
+        self._writer = threading.Thread(target=self._writer_loop, name="candidate-data-writer", daemon=True)
+        self._writer.start()
+        
+        # Write any pending updates before the interpreter exits
+        atexit.register(self.flush)
     
     def _ensure_data_dir(self) -> None:
         """Ensure data directory exists."""
@@ -30,22 +103,130 @@ class DataHandler:
             session_id: Unique session identifier
             data: Candidate data to save
         """
-        self._ensure_data_dir()
+        # Normalize in place: the record is cached and shared with the live conversation
+        for key, normalize in self._NORMALIZERS.items():
+            if key in data:
+                data[key] = normalize(data[key])
         
-        # Add timestamp
-        data["timestamp"] = datetime.datetime.now().isoformat()
+        with self._lock:
+            self._cache_record(session_id, data)
+            self._dirty.discard(session_id)
+            self._write(session_id, data)
+    
+    def _cache_record(self, session_id: str, data: Dict[str, Any]) -> None:
+        """
+        Cache a candidate record as most recently used, evicting the oldest past the limit.
+        
+        Must be called with the lock held.
+        
+        Args:
+            session_id: Unique session identifier
+            data: Candidate record to cache
+        """
+        self._cache[session_id] = data
+        self._cache.move_to_end(session_id)
         
+        while len(self._cache) > self.max_cached_sessions:
+            evicted_id, evicted = self._cache.popitem(last=False)
+            if evicted_id in self._dirty:
+                # Don't lose updates that only exist in memory
+                self._dirty.discard(evicted_id)
+                self._write(evicted_id, evicted)
+            self._last_digest.pop(evicted_id, None)
+    
+    def _write(self, session_id: str, data: Dict[str, Any]) -> None:
+        """
+        Serialize a candidate record and queue it for the background writer.
+        
+        Args:
+            session_id: Unique session identifier
+            data: Candidate data to write
+        """
         file_path = os.path.join(self.data_dir, f"candidate_{session_id}.json")
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving candidate data: {e}")
+            # Skip the write when nothing but the timestamp would change
+            record = {key: value for key, value in data.items() if key != "timestamp"}
+            content = _dumps(record)
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            last_written = self._last_digest.get(session_id)
+            if last_written and last_written[0] == digest:
+                # Keep the timestamp of the identical record already on disk
+                data["timestamp"] = last_written[1]
+                return
+            
+            # Add timestamp
+            data["timestamp"] = datetime.datetime.now().isoformat()
+            
+            # Reuse the digested bytes so later changes to data can't leak into the queued write
+            done = threading.Event()
+            self._pending[session_id] = done
+            self._write_queue.put((session_id, file_path, _add_timestamp(content, record, data["timestamp"]), done))
+            self._last_digest[session_id] = (digest, data["timestamp"])
+        except Exception:
+            logger.exception("Error saving candidate data for session %s", session_id)
+    
+    def _writer_loop(self) -> None:
+        """Write queued records to disk in order, off the request thread."""
+        while True:
+            session_id, file_path, payload, done = self._write_queue.get()
+            tmp_path = f"{file_path}.tmp"
+            try:
+                self._ensure_data_dir()
+                # Write a temp file and rename it over the target so a crash never leaves truncated JSON
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, file_path)
+            except Exception:
+                logger.exception("Error writing candidate data for session %s", session_id)
+                with self._lock:
+                    # Forget the fingerprint so the next save retries the write
+                    self._last_digest.pop(session_id, None)
+                    if self._pending.get(session_id) is done:
+                        # This was the latest record: keep it in memory and dirty, even if it was evicted
+                        if session_id not in self._cache:
+                            self._cache_record(session_id, _loads(payload))
+                        self._dirty.add(session_id)
+            finally:
+                with self._lock:
+                    if self._pending.get(session_id) is done:
+                        del self._pending[session_id]
+                done.set()
+                self._write_queue.task_done()
+    
+    def flush(self, session_id: Optional[str] = None) -> None:
+        """
+        Write cached updates that have not reached disk yet and wait for their queued writes to finish.
+        
+        Args:
+            session_id: Only flush this session (all dirty sessions if omitted)
+        """
+        with self._lock:
+            if session_id is None:
+                sessions = list(self._dirty)
+            elif session_id in self._dirty:
+                sessions = [session_id]
+            else:
+                sessions = []
+            
+            for sid in sessions:
+                self._dirty.discard(sid)
+                self._write(sid, self._cache[sid])
+            
+            # Only wait for writes queued so far, not ones other sessions keep adding
+            if session_id is None:
+                pending = list(self._pending.values())
+            else:
+                pending = [self._pending[session_id]] if session_id in self._pending else []
+        
+        for done in pending:
+            done.wait()
     
     def load_candidate_data(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
-        Load candidate data from file.
+        Load candidate data, reading the file only on first access.
+        
+        A read from disk first waits for the session's queued write, so it never sees an older file.
         
         Args:
             session_id: Unique session identifier
@@ -53,22 +234,41 @@ class DataHandler:
         Returns:
             Candidate data dict or None if not found
         """
+        with self._lock:
+            cached = self._cache.get(session_id)
+            if cached is not None:
+                self._cache.move_to_end(session_id)
+                return cached
+            # Same wait as flush(session_id): the record may be queued but not yet on disk
+            done = self._pending.get(session_id)
+        
+        if done is not None:
+            done.wait()
+        
         file_path = os.path.join(self.data_dir, f"candidate_{session_id}.json")
         
-        if not os.path.exists(file_path):
-            return None
-            
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading candidate data: {e}")
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # Unreadable file or invalid JSON (orjson.JSONDecodeError is a ValueError too)
+            logger.error("Error loading candidate data for session %s: %s", session_id, e)
             return None
+        
+        with self._lock:
+            # Another thread may have saved this session while we were reading
+            cached = self._cache.get(session_id)
+            if cached is not None:
+                return cached
+            self._cache_record(session_id, data)
+            return data
     
     def update_candidate_data(self, session_id: str, 
                              updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Update existing candidate data.
+        Update existing candidate data in memory; the file is written on flush().
         
         Args:
             session_id: Unique session identifier
@@ -77,6 +277,10 @@ class DataHandler:
         Returns:
             Updated candidate data or None on error
         """
+        updates = {
+            key: self._NORMALIZERS[key](value) if key in self._NORMALIZERS else value
+            for key, value in updates.items()
+        }
         current_data = self.load_candidate_data(session_id)
         
         if not current_data:
@@ -84,15 +288,14 @@ class DataHandler:
             self.save_candidate_data(session_id, updates)
             return updates
         
-        # Update data
-        current_data.update(updates)
-        
-        # Save updated data
-        self.save_candidate_data(session_id, current_data)
+        # Update data and mark it for the next flush
+        with self._lock:
+            current_data.update(updates)
+            self._dirty.add(session_id)
         
         return current_data
     
-    def get_tech_stack(self, session_id: str) -> List[str]:
+    def get_tech_stack(self, session_id: str) -> Tuple[str, ...]:
         """
         Get candidate's tech stack.
         
@@ -100,14 +303,15 @@ class DataHandler:
             session_id: Unique session identifier
             
         Returns:
-            List of technologies or empty list if not found
+            Read-only tuple of technologies or empty tuple if not found
         """
         data = self.load_candidate_data(session_id)
         
         if not data or "tech_stack" not in data:
-            return []
+            return ()
             
-        return data["tech_stack"]
+        # The cached record is shared with the live conversation, so hand out an immutable view
+        return tuple(data["tech_stack"])
     
     def get_experience_years(self, session_id: str) -> int:
         """
@@ -123,11 +327,16 @@ class DataHandler:
         
         if not data or "years_experience" not in data:
             return 0
+        
+        years = data["years_experience"]
+        if type(years) is int:
+            # Already normalized at ingest time
+            return years
             
         try:
-            return int(data["years_experience"])
-        except (ValueError, TypeError):
-            # Handle case where experience is not a valid integer
+            return int(years)
+        except (ValueError, TypeError, OverflowError):
+            # Handle case where experience is not a valid integer (or is an infinite float)
             return 0
     
     def store_technical_questions(self, session_id: str, 
@@ -139,13 +348,7 @@ class DataHandler:
             session_id: Unique session identifier
             questions: List of technical questions
         """
-        data = self.load_candidate_data(session_id) or {}
-        
-        # Add questions to data
-        data["technical_questions"] = questions
-        
-        # Save updated data
-        self.save_candidate_data(session_id, data)
+        self.update_candidate_data(session_id, {"technical_questions": questions})
     
     def get_candidate_summary(self, session_id: str) -> str:
         """
@@ -182,20 +385,17 @@ class DataHandler:
         # Tech stack
         if "tech_stack" in data and data["tech_stack"]:
             summary_lines.append("\nTech Stack:")
-            for tech in data["tech_stack"]:
-                summary_lines.append(f"- {tech}")
+            summary_lines.extend(f"- {tech}" for tech in data["tech_stack"])
                 
         # Technical questions
         if "technical_questions" in data and data["technical_questions"]:
             summary_lines.append("\nTechnical Questions Asked:")
-            for i, question in enumerate(data["technical_questions"], 1):
-                summary_lines.append(f"{i}. {question}")
+            summary_lines.extend(f"{i}. {question}" for i, question in enumerate(data["technical_questions"], 1))
                 
         # Answers if available
         if "technical_answers" in data and data["technical_answers"]:
             summary_lines.append("\nCandidate's Answers:")
-            for i, answer in enumerate(data["technical_answers"], 1):
-                summary_lines.append(f"Q{i}: {answer[:100]}...")
+            summary_lines.extend(f"Q{i}: {answer[:100]}..." for i, answer in enumerate(data["technical_answers"], 1))
         
         # Sentiment analysis information if available
         if "sentiment_analysis" in data:
@@ -208,8 +408,7 @@ class DataHandler:
                 
             if "emotional_shifts" in sentiment and sentiment.get("emotional_shifts"):
                 summary_lines.append("Emotional Shifts Detected:")
-                for shift in sentiment["emotional_shifts"]:
-                    summary_lines.append(f"- {shift[0]} → {shift[1]}")
+                summary_lines.extend(f"- {shift[0]} → {shift[1]}" for shift in sentiment["emotional_shifts"])
         
         # Sentiment history if available
         if "sentiment_history" in data and len(data["sentiment_history"]) > 0:
@@ -218,7 +417,9 @@ class DataHandler:
             significant_emotions = [item for item in data["sentiment_history"] 
                                   if item["emotion"] != "neutral" and item["score"] > 0.7]
             if significant_emotions:
-                for i, item in enumerate(significant_emotions[:3], 1):  # Show up to 3
-                    summary_lines.append(f"Response {i}: {item['emotion']} ({item['score']:.2f})")
+                summary_lines.extend(  # Show up to 3
+                    f"Response {i}: {item['emotion']} ({item['score']:.2f})"
+                    for i, item in enumerate(significant_emotions[:3], 1)
+                )
                 
         return "\n".join(summary_lines) 
\ No newline at end of file
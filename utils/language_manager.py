@@ -4,15 +4,169 @@ Language Manager for TalentScout Hiring Assistant.
 Handles multilingual support, language detection, and translation.
 """
 import re
-from typing import Dict, List, Optional, Tuple, Any
-import json
-import os
+import threading
+import unicodedata
+from types import MappingProxyType
+from collections import OrderedDict
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+
+# Word tokenizer used to split keyword alternations and input text the same way \b does
+_WORD_RE = re.compile(r"\w+")
+
+# Maps every ASCII character outside \w to a space, so ASCII text splits into the same tokens
+_ASCII_WORD_DELIMITERS = str.maketrans({
+    char: " " for char in map(chr, range(128)) if not (char.isalnum() or char == "_")
+})
+
+# Cultural data validation patterns, keyed by the context's date_format
+_DATE_PATTERNS = {
+    "DD/MM/YYYY": re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    "MM/DD/YYYY": re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    "YYYY/MM/DD": re.compile(r'\d{4}/\d{1,2}/\d{1,2}'),
+    "DD.MM.YYYY": re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}'),
+    "YYYY.MM.DD": re.compile(r'\d{4}\.\d{1,2}\.\d{1,2}')
+}
+_DEFAULT_DATE_PATTERN = re.compile(r'\d{1,2}[/\-.]\d{1,2}[/\-.]\d{4}')
+
+# Characters other than digits and common phone punctuation
+_PHONE_STRIP_RE = re.compile(r'[^\d+\-\s\(\)]')
+
+def _normalize_text(text: str) -> str:
+    """
+    Fold text to the form detection keywords are stored in.
+    
+    NFKC maps fullwidth forms, ligatures and decomposed accents (e + U+0301) onto their
+    standard characters, and casefold lowercases more thoroughly than lower() (e.g. ß -> ss).
+    
+    Args:
+        text: Raw text
+        
+    Returns:
+        Normalized, casefolded text
+    """
+    return unicodedata.normalize("NFKC", text).casefold()
+
+# Unicode blocks that identify a language (or a script shared by several) on their own,
+# as sorted (first code point, last code point, script) ranges for bisect lookup
+_SCRIPT_RANGES = (
+    (0x0400, 0x04FF, "ru"),
+    (0x0600, 0x06FF, "arabic"),
+    (0x0750, 0x077F, "arabic"),
+    (0x0900, 0x097F, "devanagari"),
+    (0x0980, 0x09FF, "bn"),
+    (0x0A00, 0x0A7F, "pa"),
+    (0x0A80, 0x0AFF, "gu"),
+    (0x0B80, 0x0BFF, "ta"),
+    (0x0C00, 0x0C7F, "te"),
+    (0x0C80, 0x0CFF, "kn"),
+    (0x0D00, 0x0D7F, "ml"),
+    (0x1100, 0x11FF, "ko"),
+    (0x3040, 0x30FF, "kana"),
+    (0x3130, 0x318F, "ko"),
+    (0x3400, 0x4DBF, "han"),
+    (0x4E00, 0x9FFF, "han"),
+    (0xAC00, 0xD7AF, "ko"),
+    (0xFB50, 0xFDFF, "arabic"),
+    (0xFE70, 0xFEFF, "arabic"),
+)
+_SCRIPT_STARTS = tuple(start for start, _, _ in _SCRIPT_RANGES)
+
+# Matches any character from the blocks above, to skip the per-character scan for Latin text
+_SCRIPT_CHAR_RE = re.compile("[" + "".join(f"\\u{start:04x}-\\u{end:04x}" for start, end, _ in _SCRIPT_RANGES) + "]")
+
+# Letters used in Urdu (and Persian) but not in Arabic
+_URDU_LETTERS = frozenset("ےںٹڈڑہیک")
+
+def _trie_alternation(keywords: List[str]) -> str:
+    """
+    Build a regex alternation of the keywords with shared prefixes factored out.
+    
+    The regex engine then walks a common prefix once instead of retrying it for every
+    keyword that starts with it. Longer keywords are tried before shorter prefixes of them.
+    
+    Args:
+        keywords: Literal keywords
+        
+    Returns:
+        Regex source matching exactly the given keywords
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End-of-keyword marker
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        alternation = "|".join(branches)
+        if "" in node:
+            return "(?:" + alternation + ")?"
+        return "(?:" + alternation + ")" if len(branches) > 1 else alternation
+    
+    return build(trie)
+
+def _build_keyword_index(language_patterns: Mapping[str, Tuple[str, ...]]) -> Tuple[Tuple[str, ...], Dict[str, Tuple[int, ...]], Tuple[Tuple[int, re.Pattern], ...], Tuple[Tuple[int, re.Pattern], ...]]:
+    """
+    Split the \\b(word|word|...)\\b detection patterns into a keyword index and residual regexes.
+    
+    A plain-word keyword (all \\w characters) matches exactly when it is one of the text's
+    \\w+ tokens, so a single tokenization plus dict lookups finds it for every language at once.
+    Keywords with other characters (spaces, apostrophes, hyphens, Indic vowel signs), and any
+    plain word that also occurs inside one of them, stay in a compiled regex per language so
+    findall's non-overlapping semantics are preserved. Languages are referred to by their
+    ordinal in the returned code tuple so scoring can use a flat list instead of a dict.
+    
+    Args:
+        language_patterns: Language code -> tuple of \\b(...)\\b alternation patterns
+        
+    Returns:
+        Tuple of (language codes, keyword -> language ordinals,
+        (language ordinal, residual compiled pattern) pairs for languages that need one,
+        the same pairs restricted to ASCII keywords for scanning ASCII-only text)
+    """
+    lang_codes = tuple(language_patterns)
+    keyword_languages: Dict[str, List[int]] = {}
+    residual_patterns: List[Tuple[int, re.Pattern]] = []
+    ascii_residual_patterns: List[Tuple[int, re.Pattern]] = []
+    
+    for lang_index, patterns in enumerate(language_patterns.values()):
+        regex_keywords: List[str] = []
+        for pattern in patterns:
+            keywords = _normalize_text(pattern[len(r"\b("):-len(r")\b")]).split("|")
+            complex_keywords = {keyword for keyword in keywords if not _WORD_RE.fullmatch(keyword)}
+            inner_words = {word for keyword in complex_keywords for word in _WORD_RE.findall(keyword)}
+            
+            for keyword in keywords:
+                if keyword in complex_keywords or keyword in inner_words:
+                    if keyword not in regex_keywords:
+                        regex_keywords.append(keyword)
+                else:
+                    languages = keyword_languages.setdefault(keyword, [])
+                    if lang_index not in languages:
+                        languages.append(lang_index)
+        
+        if regex_keywords:
+            # One alternation per language so the text is scanned once; keywords and
+            # input are both casefolded, so no IGNORECASE
+            residual_patterns.append((lang_index, re.compile(r"\b(" + _trie_alternation(regex_keywords) + r")\b")))
+            # Non-ASCII keywords can never match ASCII-only text
+            ascii_keywords = [keyword for keyword in regex_keywords if keyword.isascii()]
+            if ascii_keywords:
+                ascii_residual_patterns.append((lang_index, re.compile(r"\b(" + _trie_alternation(ascii_keywords) + r")\b")))
+    
+    keyword_index = {keyword: tuple(languages) for keyword, languages in keyword_languages.items()}
+    return lang_codes, keyword_index, tuple(residual_patterns), tuple(ascii_residual_patterns)
 
 class LanguageManager:
     """Manages multilingual support for the TalentScout chatbot."""
     
-    # Supported languages with their codes and names
-    SUPPORTED_LANGUAGES = {
+    # Supported languages with their codes and names (read-only; shared by every session)
+    SUPPORTED_LANGUAGES = MappingProxyType({
         "en": {
             "name": "English",
             "native_name": "English",
@@ -118,101 +272,362 @@ class LanguageManager:
             "native_name": "العربية",
             "flag": "🇸🇦"
         }
+    })
+    
+    # Make each language's info read-only too, since get_language_info hands it out directly
+    SUPPORTED_LANGUAGES = MappingProxyType({code: MappingProxyType(info) for code, info in SUPPORTED_LANGUAGES.items()})
+    
+    # Supported language codes for membership checks
+    _SUPPORTED_CODES = frozenset(SUPPORTED_LANGUAGES)
+    
+    # Language selection prompt, built once since the language list never changes
+    _LANGUAGE_SELECTOR_PROMPT = (
+        "Please select your preferred language for this interview:\n\n"
+        + "".join(
+            f"{info['flag']} {info['native_name']} ({info['name']}) - Type '{code}'\n"
+            for code, info in SUPPORTED_LANGUAGES.items()
+        )
+        + "\nOr simply start typing in your preferred language and I'll detect it automatically."
+    )
+    
+    # Localized greetings, keyed by language code
+    _GREETINGS = MappingProxyType({
+        "en": "Hello! Welcome to TalentScout. I'm here to help you with your initial screening interview.",
+        "es": "¡Hola! Bienvenido a TalentScout. Estoy aquí para ayudarte con tu entrevista de preselección inicial.",
+        "fr": "Bonjour ! Bienvenue chez TalentScout. Je suis ici pour vous aider avec votre entretien de présélection initial.",
+        "de": "Hallo! Willkommen bei TalentScout. Ich bin hier, um Ihnen bei Ihrem ersten Vorstellungsgespräch zu helfen.",
+        "it": "Ciao! Benvenuto in TalentScout. Sono qui per aiutarti con la tua intervista di preselezione iniziale.",
+        "pt": "Olá! Bem-vindo ao TalentScout. Estou aqui para ajudá-lo com sua entrevista de triagem inicial.",
+        "ru": "Привет! Добро пожаловать в TalentScout. Я здесь, чтобы помочь вам с первоначальным собеседованием.",
+        "zh": "你好！欢迎来到TalentScout。我在这里帮助您进行初步筛选面试。",
+        "ja": "こんにちは！TalentScoutへようこそ。初回面接のお手伝いをさせていただきます。",
+        "ko": "안녕하세요! TalentScout에 오신 것을 환영합니다. 초기 선별 면접을 도와드리겠습니다.",
+        "hi": "नमस्ते! TalentScout में आपका स्वागत है। मैं आपकी प्रारंभिक स्क्रीनिंग साक्षात्कार में मदद करने के लिए यहां हूं।",
+        "bn": "নমস্কার! TalentScout-এ স্বাগতম। আমি আপনার প্রাথমিক স্ক্রিনিং ইন্টারভিউতে সাহায্য করার জন্য এখানে আছি।",
+        "ta": "வணக்கம்! TalentScout-க்கு வரவேற்கிறோம். நான் உங்கள் ஆரம்ப தேர்வு நேர்காணலில் உதவ இங்கே இருக்கிறேன்.",
+        "te": "నమస్కారం! TalentScout కి స్వాగతం. నేను మీ ప్రారంభ స్క్రీనింగ్ ఇంటర్వ్యూలో సహాయం చేయడానికి ఇక్కడ ఉన్నాను.",
+        "mr": "नमस्कार! TalentScout मध्ये आपले स्वागत आहे. मी तुमच्या प्रारंभिक स्क्रीनिंग मुलाखतीत मदत करण्यासाठी येथे आहे.",
+        "gu": "નમસ્તે! TalentScout માં આપનું સ્વાગત છે. હું તમારી પ్રારંભિક સ్ક్રీનિંગ ઇન్ટરવ્યૂમાં મદદ કરવા માટે અહીં છું.",
+        "kn": "ನಮಸ್ಕಾರ! TalentScout ಗೆ ಸುಸ್ವಾಗತ. ನಾನು ನಿಮ್ಮ ಆರಂಭಿಕ ಸ್ಕ್ರೀನಿಂಗ್ ಸಂದರ್ಶನದಲ್ಲಿ ಸಹಾಯ ಮಾಡಲು ಇಲ್ಲಿ ಇದ್ದೇನೆ.",
+        "ml": "നമസ്കാരം! TalentScout-ലേക്ക് സ്വാഗതം. നിങ്ങളുടെ പ്രാരംഭ സ്ക്രീനിംഗ് ഇന്റർവ്യൂവിൽ സഹായിക്കാൻ ഞാൻ ഇവിടെയുണ്ട്.",
+        "pa": "ਸਤ ਸ੍ਰੀ ਅਕਾਲ! TalentScout ਵਿੱਚ ਤੁਹਾਡਾ ਸਵਾਗਤ ਹੈ। ਮੈਂ ਤੁਹਾਡੀ ਸ਼ੁਰੂਆਤੀ ਸਕ੍ਰੀਨਿੰਗ ਇੰਟਰਵਿਊ ਵਿੱਚ ਮਦਦ ਕਰਨ ਲਈ ਇੱਥੇ ਹਾਂ।",
+        "ur": "السلام علیکم! TalentScout میں آپ کا خیر مقدم ہے۔ میں آپ کی ابتدائی اسکریننگ انٹرویو میں مدد کرنے کے لیے یہاں ہوں۔",
+        "ar": "مرحبا! أهلا وسهلا بك في TalentScout. أنا هنا لمساعدتك في مقابلة الفحص الأولي."
+    })
+    
+    # Translation instruction wrapped around prompts for non-English conversations,
+    # with the per-language header built once
+    _TRANSLATION_HEADERS = MappingProxyType({
+        code: f"""
+        Please translate the following text to {info['name']} ({code}).
+        Maintain the professional tone and technical accuracy of the original text.
+        
+        Original text:
+        """
+        for code, info in SUPPORTED_LANGUAGES.items()
+    })
+    _TRANSLATION_FOOTER = """
+        
+        Translation:
+        """
+    
+    # Cultural context per language, read-only since the same objects are handed to every caller
+    _CULTURAL_CONTEXTS = {
+        "en": {
+            "greeting_style": "casual_professional",
+            "formality_level": "medium",
+            "name_format": "first_last",
+            "phone_format": "+1-XXX-XXX-XXXX",
+            "date_format": "MM/DD/YYYY",
+            "time_format": "12_hour",
+            "currency": "USD",
+            "professional_titles": ("Mr.", "Ms.", "Dr.", "Prof."),
+            "communication_style": "direct",
+            "interview_expectations": "punctual, prepared, confident"
+        },
+        "es": {
+            "greeting_style": "warm_professional",
+            "formality_level": "high",
+            "name_format": "first_paternal_maternal",
+            "phone_format": "+XX-XXX-XXX-XXXX",
+            "date_format": "DD/MM/YYYY",
+            "time_format": "24_hour",
+            "currency": "EUR/USD/local",
+            "professional_titles": ("Sr.", "Sra.", "Dr.", "Ing."),
+            "communication_style": "relationship_focused",
+            "interview_expectations": "respectful, family_context_ok, relationship_building"
+        },
+        "fr": {
+            "greeting_style": "formal_professional",
+            "formality_level": "high",
+            "name_format": "first_last",
+            "phone_format": "+33-X-XX-XX-XX-XX",
+            "date_format": "DD/MM/YYYY",
+            "time_format": "24_hour",
+            "currency": "EUR",
+            "professional_titles": ("M.", "Mme.", "Dr.", "Prof."),
+            "communication_style": "formal_structured",
+            "interview_expectations": "formal, well_prepared, intellectual_discussion"
+        },
+        "de": {
+            "greeting_style": "formal_professional",
+            "formality_level": "high",
+            "name_format": "first_last",
+            "phone_format": "+49-XXX-XXXXXXX",
+            "date_format": "DD.MM.YYYY",
+            "time_format": "24_hour",
+            "currency": "EUR",
+            "professional_titles": ("Herr", "Frau", "Dr.", "Prof."),
+            "communication_style": "direct_structured",
+            "interview_expectations": "punctual, thorough, technical_competence"
+        },
+        "it": {
+            "greeting_style": "warm_professional",
+            "formality_level": "medium_high",
+            "name_format": "first_last",
+            "phone_format": "+39-XXX-XXX-XXXX",
+            "date_format": "DD/MM/YYYY",
+            "time_format": "24_hour",
+            "currency": "EUR",
+            "professional_titles": ("Sig.", "Sig.ra", "Dott.", "Prof."),
+            "communication_style": "expressive_professional",
+            "interview_expectations": "personable, passionate, competent"
+        },
+        "pt": {
+            "greeting_style": "warm_professional",
+            "formality_level": "medium_high",
+            "name_format": "first_last",
+            "phone_format": "+55-XX-XXXXX-XXXX",
+            "date_format": "DD/MM/YYYY",
+            "time_format": "24_hour",
+            "currency": "BRL/EUR",
+            "professional_titles": ("Sr.", "Sra.", "Dr.", "Prof."),
+            "communication_style": "relationship_focused",
+            "interview_expectations": "friendly, competent, team_oriented"
+        },
+        "ru": {
+            "greeting_style": "formal_professional",
+            "formality_level": "high",
+            "name_format": "first_patronymic_last",
+            "phone_format": "+7-XXX-XXX-XX-XX",
+            "date_format": "DD.MM.YYYY",
+            "time_format": "24_hour",
+            "currency": "RUB",
+            "professional_titles": ("Господин", "Госпожа", "Доктор"),
+            "communication_style": "formal_hierarchical",
+            "interview_expectations": "respectful, well_prepared, technical_depth"
+        },
+        "zh": {
+            "greeting_style": "respectful_professional",
+            "formality_level": "high",
+            "name_format": "family_first",
+            "phone_format": "+86-XXX-XXXX-XXXX",
+            "date_format": "YYYY/MM/DD",
+            "time_format": "24_hour",
+            "currency": "CNY",
+            "professional_titles": ("先生", "女士", "博士", "教授"),
+            "communication_style": "hierarchical_respectful",
+            "interview_expectations": "humble, prepared, respect_for_authority"
+        },
+        "ja": {
+            "greeting_style": "very_formal_professional",
+            "formality_level": "very_high",
+            "name_format": "family_first",
+            "phone_format": "+81-XX-XXXX-XXXX",
+            "date_format": "YYYY/MM/DD",
+            "time_format": "24_hour",
+            "currency": "JPY",
+            "professional_titles": ("さん", "様", "博士", "教授"),
+            "communication_style": "extremely_polite",
+            "interview_expectations": "extremely_polite, humble, group_harmony"
+        },
+        "ko": {
+            "greeting_style": "respectful_professional",
+            "formality_level": "high",
+            "name_format": "family_first",
+            "phone_format": "+82-XX-XXXX-XXXX",
+            "date_format": "YYYY.MM.DD",
+            "time_format": "24_hour",
+            "currency": "KRW",
+            "professional_titles": ("씨", "님", "박사", "교수"),
+            "communication_style": "hierarchical_respectful",
+            "interview_expectations": "respectful, age_hierarchy_aware, team_oriented"
+        },
+        "hi": {
+            "greeting_style": "respectful_warm",
+            "formality_level": "medium_high",
+            "name_format": "first_last",
+            "phone_format": "+91-XXXXX-XXXXX",
+            "date_format": "DD/MM/YYYY",
+            "time_format": "12_hour",
+            "currency": "INR",
+            "professional_titles": ("श्री", "श्रीमती", "डॉ.", "प्रो."),
+            "communication_style": "respectful_relationship_focused",
+            "interview_expectations": "respectful, family_context_ok, educational_background"
+        },
+        "ar": {
+            "greeting_style": "formal_respectful",
+            "formality_level": "high",
+            "name_format": "first_father_family",
+            "phone_format": "+XXX-X-XXX-XXXX",
+            "date_format": "DD/MM/YYYY",
+            "time_format": "12_hour",
+            "currency": "local",
+            "professional_titles": ("السيد", "السيدة", "الدكتور", "الأستاذ"),
+            "communication_style": "formal_respectful",
+            "interview_expectations": "respectful, religious_considerations, family_context"
+        }
     }
+    _CULTURAL_CONTEXTS = MappingProxyType({code: MappingProxyType(context) for code, context in _CULTURAL_CONTEXTS.items()})
     
-    # Language detection patterns
-    LANGUAGE_PATTERNS = {
-        "en": [
+    # Default cultural context for languages not specifically defined
+    _DEFAULT_CULTURAL_CONTEXT = MappingProxyType({
+        "greeting_style": "professional",
+        "formality_level": "medium",
+        "name_format": "first_last",
+        "phone_format": "international",
+        "date_format": "DD/MM/YYYY",
+        "time_format": "24_hour",
+        "currency": "local",
+        "professional_titles": ("Mr.", "Ms.", "Dr."),
+        "communication_style": "professional",
+        "interview_expectations": "professional, competent, prepared"
+    })
+    
+    # Minimum name parts and the error shown below it, per cultural name format (other formats are not checked)
+    _NAME_FORMAT_RULES = MappingProxyType({
+        "first_last": (2, "Please provide both first and last name"),
+        "first_paternal_maternal": (2, "Please provide at least first name and paternal surname"),
+        "family_first": (2, "Please provide both family and given name"),
+        "first_patronymic_last": (2, "Please provide at least first and last name")
+    })
+    
+    # Greeting wrappers per cultural greeting style, filled with the base greeting
+    _GREETING_STYLE_TEMPLATES = MappingProxyType({
+        "very_formal_professional": "🙏 {}\n\nI will conduct this interview with the utmost respect and professionalism.",
+        "formal_professional": "🤝 {}\n\nI look forward to learning about your professional background.",
+        "warm_professional": "😊 {}\n\nI'm excited to learn about you and your experience!",
+        "respectful_warm": "🙏 {}\n\nI hope you and your family are doing well. Let's begin our conversation.",
+        "respectful_professional": "🙏 {}\n\nThank you for taking the time to speak with me today."
+    })
+    _DEFAULT_GREETING_STYLE_TEMPLATE = "👋 {}\n\nLet's get started with your interview!"
+    
+    # Language detection patterns (read-only)
+    LANGUAGE_PATTERNS = MappingProxyType({
+        "en": (
             r"\b(hello|hi|hey|good|morning|afternoon|evening|name|email|phone|experience|years|position|location|tech|stack|programming|language|framework|database|cloud|tool)\b",
             r"\b(thank|you|please|help|assist|interview|candidate|recruitment|job|career|skill|technology)\b"
-        ],
-        "es": [
+        ),
+        "es": (
             r"\b(hola|buenos|días|tardes|noches|nombre|correo|teléfono|experiencia|años|posición|ubicación|tecnología|programación|lenguaje|marco|base|datos|nube|herramienta)\b",
             r"\b(gracias|por|favor|ayuda|asistir|entrevista|candidato|reclutamiento|trabajo|carrera|habilidad)\b"
-        ],
-        "fr": [
+        ),
+        "fr": (
             r"\b(bonjour|salut|bon|matin|après-midi|soir|nom|email|téléphone|expérience|années|poste|localisation|technologie|programmation|langage|cadre|base|données|nuage|outil)\b",
             r"\b(merci|s'il|vous|plaît|aider|assister|entretien|candidat|recrutement|travail|carrière|compétence)\b"
-        ],
-        "de": [
+        ),
+        "de": (
             r"\b(hallo|guten|morgen|tag|abend|name|email|telefon|erfahrung|jahre|position|standort|technologie|programmierung|sprache|rahmen|datenbank|wolke|werkzeug)\b",
             r"\b(danke|bitte|helfen|unterstützen|interview|kandidat|rekrutierung|arbeit|karriere|fähigkeit)\b"
-        ],
-        "it": [
+        ),
+        "it": (
             r"\b(ciao|buongiorno|buonasera|nome|email|telefono|esperienza|anni|posizione|località|tecnologia|programmazione|linguaggio|framework|database|cloud|strumento)\b",
             r"\b(grazie|per|favore|aiutare|assistere|intervista|candidato|reclutamento|lavoro|carriera|abilità)\b"
-        ],
-        "pt": [
+        ),
+        "pt": (
             r"\b(olá|bom|dia|tarde|noite|nome|email|telefone|experiência|anos|posição|localização|tecnologia|programação|linguagem|framework|banco|dados|nuvem|ferramenta)\b",
             r"\b(obrigado|por|favor|ajudar|assistir|entrevista|candidato|recrutamento|trabalho|carreira|habilidade)\b"
-        ],
-        "ru": [
+        ),
+        "ru": (
             r"\b(привет|здравствуйте|добрый|утро|день|вечер|имя|почта|телефон|опыт|годы|позиция|местоположение|технология|программирование|язык|фреймворк|база|данных|облако|инструмент)\b",
             r"\b(спасибо|пожалуйста|помочь|помощь|собеседование|кандидат|рекрутинг|работа|карьера|навык)\b"
-        ],
-        "zh": [
+        ),
+        "zh": (
             r"\b(你好|早上好|下午好|晚上好|姓名|邮箱|电话|经验|年|职位|位置|技术|编程|语言|框架|数据库|云|工具)\b",
             r"\b(谢谢|请|帮助|协助|面试|候选人|招聘|工作|职业|技能)\b"
-        ],
-        "ja": [
+        ),
+        "ja": (
             r"\b(こんにちは|おはよう|こんばんは|名前|メール|電話|経験|年|職位|場所|技術|プログラミング|言語|フレームワーク|データベース|クラウド|ツール)\b",
             r"\b(ありがとう|お願い|助ける|支援|面接|候補者|採用|仕事|キャリア|スキル)\b"
-        ],
-        "ko": [
+        ),
+        "ko": (
             r"\b(안녕하세요|좋은|아침|오후|저녁|이름|이메일|전화|경험|년|직위|위치|기술|프로그래밍|언어|프레임워크|데이터베이스|클라우드|도구)\b",
             r"\b(감사합니다|부탁|도움|지원|면접|후보자|채용|일|경력|기술)\b"
-        ],
-        "hi": [
+        ),
+        "hi": (
             r"\b(नमस्ते|सुप्रभात|शुभ|दोपहर|शाम|नाम|ईमेल|फोन|अनुभव|साल|पद|स्थान|तकनीक|प्रोग्रामिंग|भाषा|फ्रेमवर्क|डेटाबेस|क्लाउड|उपकरण)\b",
             r"\b(धन्यवाद|कृपया|मदद|सहायता|साक्षात्कार|उम्मीदवार|भर्ती|काम|करियर|कौशल)\b"
-        ],
-        "bn": [
+        ),
+        "bn": (
             r"\b(নমস্কার|শুভ|সকাল|দুਪਹਿਰ|সাঁঁਜ|নাঁম|ইমেইল|ফোঁন|অভিজ্ঞতা|বছর|পদ|স্থান|প্রযুক্তি|প্রোগ্রামিং|ভাষা|ফ্রেমওয়ার্ক|ডাটাবেস|ক্লাউড|সরঞ্জাম)\b",
             r"\b(ধন্যবাদ|অনুগ্রহ|সাহায্য|সহায়তা|সাক্ষাৎকার|প্রার্থী|নিয়োগ|কাজ|ক্যারিয়ার|দক্ষতা)\b"
-        ],
-        "ta": [
+        ),
+        "ta": (
             r"\b(வணக்கம்|காலை|மதியம்|மாலை|பெயர்|மின்னஞ்சல்|தொலைபேசி|அனுபவம்|ஆண்டுகள்|பதவி|இடம்|தொழில்நுட்பம்|நிரலாக்கம்|மொழி|கட்டமைப்பு|தரவுத்தளம்|மேகம்|கருவி|என்ன|உங்கள்|என்|நான்)\b",
             r"\b(நன்றி|தயவுசெய்து|உதவி|ஆதரவு|நேர்காணல்|விண்ணப்பதாரர்|மனிதவளம்|வேலை|வாழ்க்கை|திறமை|கேள்வி|பதில்)\b"
-        ],
-        "te": [
+        ),
+        "te": (
             r"\b(నమస్కారం|శుభోదయం|శుభ|మధ్యాహ్నం|సాయంత్రం|పేరు|ఇమెయిల్|ఫోన్|అనుభవం|సంవత్సరాలు|పదవి|స్థానం|టెక్నాలజీ|ప్రోగ్రామింగ్|భాష|ఫ్రేమ్‌వర్క్|డేటాబేస్|క్లౌడ్|సాధనం|ఏమిటి|మీ|నా|నేను)\b",
             r"\b(ధన్యవాదాలు|దయచేసి|సహాయం|మద్దతు|ఇంటర్వ్యూ|అభ్యర్థి|నియామకాతి|కెలస|వృత్తి|కౌశల్య|ప్రశ్న|సమాధానం)\b"
-        ],
-        "mr": [
+        ),
+        "mr": (
             r"\b(नमस्कार|सुप्रभात|शुभ|दुपार|संध्याकाळ|नाव|ईमेल|फोन|अनुभव|वर्षे|पद|स्थान|तंत्रज्ञान|प्रोग्रामिंग|भाषा|फ्रेमवर्क|डेटाबेस|क्लाउड|साधन)\b",
             r"\b(धन्यवाद|कृपया|मदत|सहाय्य|मुलाखत|उमेदवार|भरती|काम|करिअर|कौशल्य)\b"
-        ],
-        "gu": [
+        ),
+        "gu": (
             r"\b(નમસ્તે|સુપ્રભાત|શુભ|બપોર|સાંજ|નામ|ઈમેલ|ફોન|અનુભવ|વર્ષ|પદ|સ્થાન|ટેકનોલોજી|પ્રોગ્રામિંગ|ભાષા|ફ્રેમવર્ક|ડેટાબેસ|ક્લાઉડ|સાધન|શું|તમારું|મારું|હું)\b",
             r"\b(ધન્યવાદ|કૃપા|મદદ|સહાય|ઇન્ટરવ્યૂ|ઉમેદવાર|ભરતી|કામ|કારકિર્દી|કૌશલ્ય|પ્રશ્ન|જવાબ)\b"
-        ],
-        "kn": [
+        ),
+        "kn": (
             r"\b(ನಮಸ್ಕಾರ|ಶುಭೋದಯ|ಶುಭ|ಮಧ್ಯಾಹ್ನ|ಸಂಜೆ|ಹೆಸರು|ಇಮೇಲ್|ಫೋನ್|ಅನುಭವ|ವರ್ಷಗಳು|ಹುದ್ದೆ|ಸ್ಥಳ|ತಂತ್ರಜ್ಞಾನ|ಪ್ರೋಗ್ರಾಮಿಂಗ್|ಭಾಷೆ|ಫ್ರೇಮ್‌ವರ್ಕ್|ಡೇಟಾಬೇಸ್|ಮೋಡ|ಉಪಕರಣ)\b",
             r"\b(ಧನ್ಯವಾದ|ದಯವಿಟ್ಟು|ಸಹಾಯ|ಬೆಂಬಲ|ಸಂದರ್ಶನ|ಅಭ್ಯರ್ಥಿ|ನೇಮಕಾತಿ|ಕೆಲಸ|ವೃತ್ತಿ|ಕೌಶಲ್ಯ)\b"
-        ],
-        "ml": [
+        ),
+        "ml": (
             r"\b(നമസ്കാരം|സുപ്രഭാതം|ശുഭ|ഉച്ച|വൈകുന്നേരം|പേര്|ഇമെയിൽ|ഫോൺ|അനുഭവം|വർഷങ്ങൾ|സ്ഥാനം|സ്ഥലം|സാങ്കേതികവിദ്യ|പ്രോഗ്രാമിംഗ്|ഭാഷ|ഫ്രെയിംവർക്ക്|ഡാറ്റാബേസ്|മേഘം|ഉപകരണം|എന്താണ്|നിങ്ങളുടെ|എന്റെ|ഞാൻ)\b",
             r"\b(നന്ദി|ദയവായി|സഹായം|പിന്തുണ|ഇന്റർവ്യൂ|അഭ്യർത്ഥി|നിയമനം|ജോലി|കരിയർ|കഴിവ്|ചോദ്യം|ഉത്തരം)\b"
-        ],
-        "pa": [
+        ),
+        "pa": (
             r"\b(ਸਤ ਸ੍ਰੀ ਅਕਾਲ|ਸ਼ੁਭ|ਸਵੇਰੇ|ਦੁਪਹਿਰ|ਸ਼ਾਮ|ਨਾਮ|ਈਮੇਲ|ਫੋਨ|ਅਨੁਭਵ|ਸਾਲ|ਪਦ|ਸਥਾਨ|ਟੈਕਨਾਲੋਜੀ|ਪ੍ਰੋਗਰਾਮਿੰਗ|ਭਾਸ਼ਾ|ਫਰੇਮਵਰਕ|ਡੇਟਾਬੇਸ|ਕਲਾਊਡ|ਸਾਧਨ)\b",
             r"\b(ਧੰਨਵਾਦ|ਕਿਰਪਾ|ਮਦਦ|ਸਹਾਇਤਾ|ਇੰਟਰਵਿਊ|ਉਮੀਦਵਾਰ|ਭਰਤੀ|ਕੰਮ|ਕਰੀਅਰ|ਕੌਸ਼ਲ)\b"
-        ],
-        "ur": [
+        ),
+        "ur": (
             r"\b(السلام علیکم|صبح بخیر|شام بخیر|نام|ای میل|فون|تجربہ|سال|عہدہ|مقام|ٹیکنالوجی|پروگرامنگ|زبان|فریم ورک|ڈیٹا بیس|کلاؤڈ|آلہ)\b",
             r"\b(شکریہ|براہ کرم|مدد|حمایت|انٹرویو|امیدوار|بھرتی|کام|کیریئر|مہارت)\b"
-        ],
-        "ar": [
+        ),
+        "ar": (
             r"\b(مرحبا|صباح|الخير|مساء|الخير|اسم|بريد|إلكتروني|هاتف|خبرة|سنوات|منصب|موقع|تقنية|برمجة|لغة|إطار|عمل|قاعدة|بيانات|سحابة|أداة)\b",
             r"\b(شكرا|من|فضلك|مساعدة|دعم|مقابلة|مرشح|توظيف|عمل|مهنة|مهارة)\b"
-        ]
-    }
+        )
+    })
+    
+    # Language ordinals, plain-word keyword index (keyword -> ordinals) and regexes for the remaining keywords
+    _LANG_CODES, _KEYWORD_LANGUAGES, _COMPILED_PATTERNS, _ASCII_COMPILED_PATTERNS = _build_keyword_index(LANGUAGE_PATTERNS)
+    
+    # Detection results are cached for messages up to this many characters
+    _CACHEABLE_TEXT_LENGTH = 128
     
-    def __init__(self):
-        """Initialize the language manager."""
+    # Longer texts (e.g. pasted resumes) are detected from their start, middle and end only
+    _MAX_DETECTION_LENGTH = 2048
+    _DETECTION_EDGE_WINDOW = 768
+    _DETECTION_MIDDLE_WINDOW = 512
+    
+    def __init__(self, max_session_preferences: int = 10000):
+        """
+        Initialize the language manager.
+        
+        Args:
+            max_session_preferences: Maximum number of per-session language preferences to keep
+        """
         self.current_language = "en"
         self.detected_languages = {}
-        self.language_preferences = {}
+        self.language_preferences = OrderedDict()
+        self.max_session_preferences = max_session_preferences
+        # Guards language_preferences; the manager is shared across sessions and threads
+        self._preferences_lock = threading.Lock()
+        # Short messages (greetings, retries, one-word answers) recur across turns and sessions
+        self._detect_cached = lru_cache(maxsize=1024)(self._detect_normalized)
+        # Keyword scores are shared by detection and switch suggestions for the same message
+        self._scores_cached = lru_cache(maxsize=1024)(self._score_languages)
         
     def detect_language(self, text: str) -> str:
         """
@@ -225,8 +640,7 @@ class LanguageManager:
             Language code (e.g., 'en', 'es', 'fr')
         """
         # Use the enhanced detection method but return only the language code for backward compatibility
-        language, _ = self.detect_language_with_confidence(text)
-        return language
+        return self.detect_language_with_confidence(text)[0]
     
     def detect_language_with_confidence(self, text: str) -> Tuple[str, float]:
         """
@@ -241,40 +655,68 @@ class LanguageManager:
         if not text or not text.strip():
             return "en", 0.0
             
-        text_lower = text.lower().strip()
+        text_lower = _normalize_text(self._sample_text(text)).strip()
+        if len(text_lower) <= self._CACHEABLE_TEXT_LENGTH:
+            return self._detect_cached(text_lower)
+        return self._detect_normalized(text_lower)
+    
+    def _sample_text(self, text: str) -> str:
+        """
+        Limit long texts to a start, middle and end window for language detection.
+        
+        The language of a message does not change halfway through, so a few hundred words
+        are enough and the cost of detection stays bounded for very long input.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            The text itself, or its sampled windows joined by spaces when it is too long
+        """
+        if len(text) <= self._MAX_DETECTION_LENGTH:
+            return text
+        
+        edge = self._DETECTION_EDGE_WINDOW
+        middle_start = (len(text) - self._DETECTION_MIDDLE_WINDOW) // 2
+        middle = text[middle_start:middle_start + self._DETECTION_MIDDLE_WINDOW]
+        return " ".join((text[:edge], middle, text[-edge:]))
+    
+    def _detect_normalized(self, text_lower: str) -> Tuple[str, float]:
+        """
+        Detect the language of already normalized and stripped text.
+        
+        Args:
+            text_lower: Normalized, stripped input text
+            
+        Returns:
+            Tuple of (language_code, confidence_score) where confidence is between 0.0 and 1.0
+        """
+        # Texts written in a script that belongs to a single language need no keyword scoring
+        script_match = self._detect_script(text_lower)
+        if script_match:
+            return script_match
+        
         text_length = len(text_lower.split())
         
         # If text is too short, confidence will be lower
         length_factor = min(1.0, text_length / 5.0)  # Full confidence at 5+ words
         
-        language_scores = {}
+        # Score each language based on unique keyword matches (avoids over-scoring repeated words)
+        # and find the highest-scoring language (first one wins ties) in the same pass
         total_matches = 0
-        
-        # Score each language based on pattern matches
-        for lang_code, patterns in self.LANGUAGE_PATTERNS.items():
-            score = 0
-            unique_matches = set()
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                # Count unique matches to avoid over-scoring repeated words
-                for match in matches:
-                    unique_matches.add(match)
-            
-            score = len(unique_matches)
-            language_scores[lang_code] = score
+        best_index = 0
+        max_score = 0
+        for lang_index, score in enumerate(self._keyword_scores(text_lower)):
             total_matches += score
-        
-        if not language_scores or total_matches == 0:
-            return "en", 0.0
-        
-        # Find the language with the highest score
-        detected_lang = max(language_scores, key=language_scores.get)
-        max_score = language_scores[detected_lang]
+            if score > max_score:
+                max_score = score
+                best_index = lang_index
         
         if max_score == 0:
             return "en", 0.0
         
+        detected_lang = self._LANG_CODES[best_index]
+        
         # Calculate confidence based on:
         # 1. Ratio of max score to total matches (dominance)
         # 2. Absolute score (strength of detection)
@@ -291,6 +733,118 @@ class LanguageManager:
         
         return detected_lang, min(1.0, confidence)
     
+    def _detect_script(self, text_lower: str) -> Optional[Tuple[str, float]]:
+        """
+        Detect the language from the writing system when the text is dominated by one script.
+        
+        Args:
+            text_lower: Normalized, stripped input text
+            
+        Returns:
+            Tuple of (language_code, confidence_score), or None when the script is Latin, mixed,
+            or shared by several supported languages (Devanagari is used by both Hindi and Marathi)
+        """
+        # ASCII and accented Latin text never reaches the per-character scan
+        if text_lower.isascii() or not _SCRIPT_CHAR_RE.search(text_lower):
+            return None
+        
+        script_counts: Dict[str, int] = {}
+        other_letters = 0
+        
+        for char in text_lower:
+            code_point = ord(char)
+            if code_point < 0x80:
+                if char.isalpha():
+                    other_letters += 1
+                continue
+            
+            position = bisect_right(_SCRIPT_STARTS, code_point) - 1
+            if position >= 0 and code_point <= _SCRIPT_RANGES[position][1]:
+                script = _SCRIPT_RANGES[position][2]
+                script_counts[script] = script_counts.get(script, 0) + 1
+            elif char.isalpha():
+                other_letters += 1
+        
+        if not script_counts:
+            return None
+        
+        # Kanji and kana are both Japanese; Han without kana is Chinese
+        if "kana" in script_counts:
+            script_counts["kana"] += script_counts.pop("han", 0)
+        
+        script = max(script_counts, key=script_counts.get)
+        script_chars = script_counts[script]
+        dominance_factor = script_chars / (sum(script_counts.values()) + other_letters)
+        if dominance_factor < 0.7 or script == "devanagari":
+            return None
+        
+        if script == "arabic":
+            lang_code = "ur" if _URDU_LETTERS.intersection(text_lower) else "ar"
+        elif script == "kana":
+            lang_code = "ja"
+        elif script == "han":
+            lang_code = "zh"
+        else:
+            lang_code = script
+        
+        # Chinese and Japanese are written without spaces, so count characters (about two per word)
+        if script in ("han", "kana"):
+            length_factor = min(1.0, script_chars / 10.0)
+        else:
+            length_factor = min(1.0, len(text_lower.split()) / 5.0)
+        
+        confidence = dominance_factor * length_factor
+        if confidence < 0.1:
+            return None
+        
+        return lang_code, min(1.0, confidence)
+    
+    def _keyword_scores(self, text_lower: str) -> Tuple[int, ...]:
+        """
+        Get per-language keyword scores, from the cache for short texts.
+        
+        Args:
+            text_lower: Normalized, stripped input text
+            
+        Returns:
+            Tuple of unique keyword counts, indexed by ordinal in _LANG_CODES
+        """
+        if len(text_lower) <= self._CACHEABLE_TEXT_LENGTH:
+            return self._scores_cached(text_lower)
+        return self._score_languages(text_lower)
+    
+    def _score_languages(self, text_lower: str) -> Tuple[int, ...]:
+        """
+        Count the unique detection keywords present in the text, per language.
+        
+        Args:
+            text_lower: Normalized input text
+            
+        Returns:
+            Tuple of unique keyword counts, indexed by ordinal in _LANG_CODES
+        """
+        scores = [0] * len(self._LANG_CODES)
+        keyword_languages = self._KEYWORD_LANGUAGES
+        
+        # One tokenization serves every language's plain-word keywords
+        is_ascii = text_lower.isascii()
+        if is_ascii:
+            tokens = set(text_lower.translate(_ASCII_WORD_DELIMITERS).split())
+        else:
+            tokens = set(_WORD_RE.findall(text_lower))
+        for token in tokens:
+            for lang_index in keyword_languages.get(token, ()):
+                scores[lang_index] += 1
+        
+        # Keywords that need regex matching; skip any already counted through the index
+        compiled_patterns = self._ASCII_COMPILED_PATTERNS if is_ascii else self._COMPILED_PATTERNS
+        for lang_index, pattern in compiled_patterns:
+            for keyword in set(pattern.findall(text_lower)):
+                if keyword not in tokens or lang_index not in keyword_languages.get(keyword, ()):
+                    scores[lang_index] += 1
+        
+        return tuple(scores)
+    
     def set_language(self, language_code: str) -> bool:
         """
         Set the current language for the conversation.
@@ -301,12 +855,12 @@ class LanguageManager:
         Returns:
             True if language is supported, False otherwise
         """
-        if language_code in self.SUPPORTED_LANGUAGES:
+        if language_code in self._SUPPORTED_CODES:
             self.current_language = language_code
             return True
         return False
     
-    def get_language_info(self, language_code: str) -> Optional[Dict]:
+    def get_language_info(self, language_code: str) -> Optional[Mapping[str, str]]:
         """
         Get information about a specific language.
         
@@ -314,16 +868,16 @@ class LanguageManager:
             language_code: Language code
             
         Returns:
-            Language information dictionary or None if not found
+            Read-only language information mapping or None if not found
         """
         return self.SUPPORTED_LANGUAGES.get(language_code)
     
-    def get_supported_languages(self) -> Dict:
+    def get_supported_languages(self) -> Mapping[str, Mapping[str, str]]:
         """
         Get all supported languages.
         
         Returns:
-            Dictionary of supported languages
+            Read-only mapping of supported languages
         """
         return self.SUPPORTED_LANGUAGES
     
@@ -342,17 +896,7 @@ class LanguageManager:
             return prompt
         
         # Add translation instruction to the prompt
-        translation_instruction = f"""
-        Please translate the following text to {self.SUPPORTED_LANGUAGES[target_language]['name']} ({target_language}).
-        Maintain the professional tone and technical accuracy of the original text.
-        
-        Original text:
-        {prompt}
-        
-        Translation:
-        """
-        
-        return translation_instruction
+        return self._TRANSLATION_HEADERS[target_language] + prompt + self._TRANSLATION_FOOTER
     
     def get_localized_greeting(self, language_code: str) -> str:
         """
@@ -364,31 +908,7 @@ class LanguageManager:
         Returns:
             Localized greeting
         """
-        greetings = {
-            "en": "Hello! Welcome to TalentScout. I'm here to help you with your initial screening interview.",
-            "es": "¡Hola! Bienvenido a TalentScout. Estoy aquí para ayudarte con tu entrevista de preselección inicial.",
-            "fr": "Bonjour ! Bienvenue chez TalentScout. Je suis ici pour vous aider avec votre entretien de présélection initial.",
-            "de": "Hallo! Willkommen bei TalentScout. Ich bin hier, um Ihnen bei Ihrem ersten Vorstellungsgespräch zu helfen.",
-            "it": "Ciao! Benvenuto in TalentScout. Sono qui per aiutarti con la tua intervista di preselezione iniziale.",
-            "pt": "Olá! Bem-vindo ao TalentScout. Estou aqui para ajudá-lo com sua entrevista de triagem inicial.",
-            "ru": "Привет! Добро пожаловать в TalentScout. Я здесь, чтобы помочь вам с первоначальным собеседованием.",
-            "zh": "你好！欢迎来到TalentScout。我在这里帮助您进行初步筛选面试。",
-            "ja": "こんにちは！TalentScoutへようこそ。初回面接のお手伝いをさせていただきます。",
-            "ko": "안녕하세요! TalentScout에 오신 것을 환영합니다. 초기 선별 면접을 도와드리겠습니다.",
-            "hi": "नमस्ते! TalentScout में आपका स्वागत है। मैं आपकी प्रारंभिक स्क्रीनिंग साक्षात्कार में मदद करने के लिए यहां हूं।",
-            "bn": "নমস্কার! TalentScout-এ স্বাগতম। আমি আপনার প্রাথমিক স্ক্রিনিং ইন্টারভিউতে সাহায্য করার জন্য এখানে আছি।",
-            "ta": "வணக்கம்! TalentScout-க்கு வரவேற்கிறோம். நான் உங்கள் ஆரம்ப தேர்வு நேர்காணலில் உதவ இங்கே இருக்கிறேன்.",
-            "te": "నమస్కారం! TalentScout కి స్వాగతం. నేను మీ ప్రారంభ స్క్రీనింగ్ ఇంటర్వ్యూలో సహాయం చేయడానికి ఇక్కడ ఉన్నాను.",
-            "mr": "नमस्कार! TalentScout मध्ये आपले स्वागत आहे. मी तुमच्या प्रारंभिक स्क्रीनिंग मुलाखतीत मदत करण्यासाठी येथे आहे.",
-            "gu": "નમસ્તે! TalentScout માં આપનું સ્વાગત છે. હું તમારી પ్રારંભિક સ్ક్રీનિંગ ઇન్ટરવ્યૂમાં મદદ કરવા માટે અહીં છું.",
-            "kn": "ನಮಸ್ಕಾರ! TalentScout ಗೆ ಸುಸ್ವಾಗತ. ನಾನು ನಿಮ್ಮ ಆರಂಭಿಕ ಸ್ಕ್ರೀನಿಂಗ್ ಸಂದರ್ಶನದಲ್ಲಿ ಸಹಾಯ ಮಾಡಲು ಇಲ್ಲಿ ಇದ್ದೇನೆ.",
-            "ml": "നമസ്കാരം! TalentScout-ലേക്ക് സ്വാഗതം. നിങ്ങളുടെ പ്രാരംഭ സ്ക്രീനിംഗ് ഇന്റർവ്യൂവിൽ സഹായിക്കാൻ ഞാൻ ഇവിടെയുണ്ട്.",
-            "pa": "ਸਤ ਸ੍ਰੀ ਅਕਾਲ! TalentScout ਵਿੱਚ ਤੁਹਾਡਾ ਸਵਾਗਤ ਹੈ। ਮੈਂ ਤੁਹਾਡੀ ਸ਼ੁਰੂਆਤੀ ਸਕ੍ਰੀਨਿੰਗ ਇੰਟਰਵਿਊ ਵਿੱਚ ਮਦਦ ਕਰਨ ਲਈ ਇੱਥੇ ਹਾਂ।",
-            "ur": "السلام علیکم! TalentScout میں آپ کا خیر مقدم ہے۔ میں آپ کی ابتدائی اسکریننگ انٹرویو میں مدد کرنے کے لیے یہاں ہوں۔",
-            "ar": "مرحبا! أهلا وسهلا بك في TalentScout. أنا هنا لمساعدتك في مقابلة الفحص الأولي."
-        }
-        
-        return greetings.get(language_code, greetings["en"])
+        return self._GREETINGS.get(language_code, self._GREETINGS["en"])
     
     def get_language_selector_prompt(self) -> str:
         """
@@ -397,14 +917,7 @@ class LanguageManager:
         Returns:
             Language selection prompt
         """
-        prompt = "Please select your preferred language for this interview:\n\n"
-        
-        for code, info in self.SUPPORTED_LANGUAGES.items():
-            prompt += f"{info['flag']} {info['native_name']} ({info['name']}) - Type '{code}'\n"
-        
-        prompt += "\nOr simply start typing in your preferred language and I'll detect it automatically."
-        
-        return prompt
+        return self._LANGUAGE_SELECTOR_PROMPT
     
     def update_language_preference(self, session_id: str, language_code: str) -> None:
         """
@@ -414,7 +927,15 @@ class LanguageManager:
             session_id: Session identifier
             language_code: Preferred language code
         """
-        self.language_preferences[session_id] = language_code
+        with self._preferences_lock:
+            if session_id in self.language_preferences:
+                # Move to end (most recently updated)
+                self.language_preferences.move_to_end(session_id)
+            self.language_preferences[session_id] = language_code
+            
+            # Forget the least recently updated session once the limit is reached
+            if len(self.language_preferences) > self.max_session_preferences:
+                self.language_preferences.popitem(last=False)
     
     def get_session_language(self, session_id: str) -> str:
         """
@@ -426,7 +947,8 @@ class LanguageManager:
         Returns:
             Language code for the session
         """
-        return self.language_preferences.get(session_id, "en")
+        with self._preferences_lock:
+            return self.language_preferences.get(session_id, "en")
     
     def auto_switch_language(self, text: str, current_language: str, session_id: str = None) -> Tuple[str, bool, str]:
         """
@@ -487,7 +1009,7 @@ class LanguageManager:
         Returns:
             Tuple of (new_language, confirmation_message)
         """
-        if target_language not in self.SUPPORTED_LANGUAGES:
+        if target_language not in self._SUPPORTED_CODES:
             return self.current_language, f"❌ Language '{target_language}' is not supported."
         
         # Update preferences
@@ -518,27 +1040,21 @@ class LanguageManager:
         if not text or not text.strip():
             return []
         
-        text_lower = text.lower().strip()
+        text_lower = _normalize_text(self._sample_text(text)).strip()
         language_scores = {}
         
+        text_length = len(text_lower.split())
+        length_factor = min(1.0, text_length / 5.0)
+        
         # Score each language based on pattern matches
-        for lang_code, patterns in self.LANGUAGE_PATTERNS.items():
+        keyword_scores = self._keyword_scores(text_lower)
+        for lang_code, unique_matches in zip(self._LANG_CODES, keyword_scores):
             if lang_code == current_language:
                 continue  # Skip current language
-                
-            score = 0
-            unique_matches = set()
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
-                    unique_matches.add(match)
             
             if unique_matches:
                 # Calculate basic confidence
-                text_length = len(text_lower.split())
-                length_factor = min(1.0, text_length / 5.0)
-                strength_factor = min(1.0, len(unique_matches) / 3.0)
+                strength_factor = min(1.0, unique_matches / 3.0)
                 confidence = strength_factor * length_factor
                 
                 if confidence > 0.1:  # Only include meaningful suggestions
@@ -548,7 +1064,7 @@ class LanguageManager:
         suggestions = sorted(language_scores.items(), key=lambda x: x[1], reverse=True)
         return suggestions[:3]  # Return top 3 suggestions
     
-    def get_cultural_context(self, language: str) -> Dict[str, Any]:
+    def get_cultural_context(self, language: str) -> Mapping[str, Any]:
         """
         Get cultural context information for a specific language.
         
@@ -556,170 +1072,9 @@ class LanguageManager:
             language: Language code
             
         Returns:
-            Dictionary containing cultural context information
-        """
-        cultural_contexts = {
-            "en": {
-                "greeting_style": "casual_professional",
-                "formality_level": "medium",
-                "name_format": "first_last",
-                "phone_format": "+1-XXX-XXX-XXXX",
-                "date_format": "MM/DD/YYYY",
-                "time_format": "12_hour",
-                "currency": "USD",
-                "professional_titles": ["Mr.", "Ms.", "Dr.", "Prof."],
-                "communication_style": "direct",
-                "interview_expectations": "punctual, prepared, confident"
-            },
-            "es": {
-                "greeting_style": "warm_professional",
-                "formality_level": "high",
-                "name_format": "first_paternal_maternal",
-                "phone_format": "+XX-XXX-XXX-XXXX",
-                "date_format": "DD/MM/YYYY",
-                "time_format": "24_hour",
-                "currency": "EUR/USD/local",
-                "professional_titles": ["Sr.", "Sra.", "Dr.", "Ing."],
-                "communication_style": "relationship_focused",
-                "interview_expectations": "respectful, family_context_ok, relationship_building"
-            },
-            "fr": {
-                "greeting_style": "formal_professional",
-                "formality_level": "high",
-                "name_format": "first_last",
-                "phone_format": "+33-X-XX-XX-XX-XX",
-                "date_format": "DD/MM/YYYY",
-                "time_format": "24_hour",
-                "currency": "EUR",
-                "professional_titles": ["M.", "Mme.", "Dr.", "Prof."],
-                "communication_style": "formal_structured",
-                "interview_expectations": "formal, well_prepared, intellectual_discussion"
-            },
-            "de": {
-                "greeting_style": "formal_professional",
-                "formality_level": "high",
-                "name_format": "first_last",
-                "phone_format": "+49-XXX-XXXXXXX",
-                "date_format": "DD.MM.YYYY",
-                "time_format": "24_hour",
-                "currency": "EUR",
-                "professional_titles": ["Herr", "Frau", "Dr.", "Prof."],
-                "communication_style": "direct_structured",
-                "interview_expectations": "punctual, thorough, technical_competence"
-            },
-            "it": {
-                "greeting_style": "warm_professional",
-                "formality_level": "medium_high",
-                "name_format": "first_last",
-                "phone_format": "+39-XXX-XXX-XXXX",
-                "date_format": "DD/MM/YYYY",
-                "time_format": "24_hour",
-                "currency": "EUR",
-                "professional_titles": ["Sig.", "Sig.ra", "Dott.", "Prof."],
-                "communication_style": "expressive_professional",
-                "interview_expectations": "personable, passionate, competent"
-            },
-            "pt": {
-                "greeting_style": "warm_professional",
-                "formality_level": "medium_high",
-                "name_format": "first_last",
-                "phone_format": "+55-XX-XXXXX-XXXX",
-                "date_format": "DD/MM/YYYY",
-                "time_format": "24_hour",
-                "currency": "BRL/EUR",
-                "professional_titles": ["Sr.", "Sra.", "Dr.", "Prof."],
-                "communication_style": "relationship_focused",
-                "interview_expectations": "friendly, competent, team_oriented"
-            },
-            "ru": {
-                "greeting_style": "formal_professional",
-                "formality_level": "high",
-                "name_format": "first_patronymic_last",
-                "phone_format": "+7-XXX-XXX-XX-XX",
-                "date_format": "DD.MM.YYYY",
-                "time_format": "24_hour",
-                "currency": "RUB",
-                "professional_titles": ["Господин", "Госпожа", "Доктор"],
-                "communication_style": "formal_hierarchical",
-                "interview_expectations": "respectful, well_prepared, technical_depth"
-            },
-            "zh": {
-                "greeting_style": "respectful_professional",
-                "formality_level": "high",
-                "name_format": "family_first",
-                "phone_format": "+86-XXX-XXXX-XXXX",
-                "date_format": "YYYY/MM/DD",
-                "time_format": "24_hour",
-                "currency": "CNY",
-                "professional_titles": ["先生", "女士", "博士", "教授"],
-                "communication_style": "hierarchical_respectful",
-                "interview_expectations": "humble, prepared, respect_for_authority"
-            },
-            "ja": {
-                "greeting_style": "very_formal_professional",
-                "formality_level": "very_high",
-                "name_format": "family_first",
-                "phone_format": "+81-XX-XXXX-XXXX",
-                "date_format": "YYYY/MM/DD",
-                "time_format": "24_hour",
-                "currency": "JPY",
-                "professional_titles": ["さん", "様", "博士", "教授"],
-                "communication_style": "extremely_polite",
-                "interview_expectations": "extremely_polite, humble, group_harmony"
-            },
-            "ko": {
-                "greeting_style": "respectful_professional",
-                "formality_level": "high",
-                "name_format": "family_first",
-                "phone_format": "+82-XX-XXXX-XXXX",
-                "date_format": "YYYY.MM.DD",
-                "time_format": "24_hour",
-                "currency": "KRW",
-                "professional_titles": ["씨", "님", "박사", "교수"],
-                "communication_style": "hierarchical_respectful",
-                "interview_expectations": "respectful, age_hierarchy_aware, team_oriented"
-            },
-            "hi": {
-                "greeting_style": "respectful_warm",
-                "formality_level": "medium_high",
-                "name_format": "first_last",
-                "phone_format": "+91-XXXXX-XXXXX",
-                "date_format": "DD/MM/YYYY",
-                "time_format": "12_hour",
-                "currency": "INR",
-                "professional_titles": ["श्री", "श्रीमती", "डॉ.", "प्रो."],
-                "communication_style": "respectful_relationship_focused",
-                "interview_expectations": "respectful, family_context_ok, educational_background"
-            },
-            "ar": {
-                "greeting_style": "formal_respectful",
-                "formality_level": "high",
-                "name_format": "first_father_family",
-                "phone_format": "+XXX-X-XXX-XXXX",
-                "date_format": "DD/MM/YYYY",
-                "time_format": "12_hour",
-                "currency": "local",
-                "professional_titles": ["السيد", "السيدة", "الدكتور", "الأستاذ"],
-                "communication_style": "formal_respectful",
-                "interview_expectations": "respectful, religious_considerations, family_context"
-            }
-        }
-        
-        # Default context for languages not specifically defined
-        default_context = {
-            "greeting_style": "professional",
-            "formality_level": "medium",
-            "name_format": "first_last",
-            "phone_format": "international",
-            "date_format": "DD/MM/YYYY",
-            "time_format": "24_hour",
-            "currency": "local",
-            "professional_titles": ["Mr.", "Ms.", "Dr."],
-            "communication_style": "professional",
-            "interview_expectations": "professional, competent, prepared"
-        }
-        
-        return cultural_contexts.get(language, default_context)
+            Read-only mapping containing cultural context information
+        """
+        return self._CULTURAL_CONTEXTS.get(language, self._DEFAULT_CULTURAL_CONTEXT)
     
     def adapt_greeting_for_culture(self, language: str, base_greeting: str) -> str:
         """
@@ -734,19 +1089,9 @@ class LanguageManager:
         """
         context = self.get_cultural_context(language)
         
-        # Add cultural adaptations based on greeting style
-        if context["greeting_style"] == "very_formal_professional":
-            return f"🙏 {base_greeting}\n\nI will conduct this interview with the utmost respect and professionalism."
-        elif context["greeting_style"] == "formal_professional":
-            return f"🤝 {base_greeting}\n\nI look forward to learning about your professional background."
-        elif context["greeting_style"] == "warm_professional":
-            return f"😊 {base_greeting}\n\nI'm excited to learn about you and your experience!"
-        elif context["greeting_style"] == "respectful_warm":
-            return f"🙏 {base_greeting}\n\nI hope you and your family are doing well. Let's begin our conversation."
-        elif context["greeting_style"] == "respectful_professional":
-            return f"🙏 {base_greeting}\n\nThank you for taking the time to speak with me today."
-        else:  # casual_professional or default
-            return f"👋 {base_greeting}\n\nLet's get started with your interview!"
+        # Add cultural adaptations based on greeting style (casual_professional and others use the default)
+        template = self._GREETING_STYLE_TEMPLATES.get(context["greeting_style"], self._DEFAULT_GREETING_STYLE_TEMPLATE)
+        return template.format(base_greeting)
     
     def validate_cultural_data_format(self, data_type: str, value: str, language: str) -> Tuple[bool, str]:
         """
@@ -760,69 +1105,54 @@ class LanguageManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        context = self.get_cultural_context(language)
+        validator = self._VALIDATORS.get(data_type)
+        if validator is None:
+            return True, ""  # No cultural rules for this data type
         
-        if data_type == "name":
-            return self._validate_name_format(value, context)
-        elif data_type == "phone":
-            return self._validate_phone_format(value, context)
-        elif data_type == "date":
-            return self._validate_date_format(value, context)
-        else:
-            return True, ""
+        return validator(self, value, self.get_cultural_context(language))
     
-    def _validate_name_format(self, name: str, context: Dict) -> Tuple[bool, str]:
+    def _validate_name_format(self, name: str, context: Mapping[str, Any]) -> Tuple[bool, str]:
         """Validate name format based on cultural context."""
-        if not name or not name.strip():
+        # split() drops surrounding whitespace, so a blank name has no parts
+        name_parts = name.split() if name else []
+        if not name_parts:
             return False, "Name cannot be empty"
         
-        name_parts = name.strip().split()
-        
-        if context["name_format"] == "first_last":
-            if len(name_parts) < 2:
-                return False, "Please provide both first and last name"
-        elif context["name_format"] == "first_paternal_maternal":
-            if len(name_parts) < 2:
-                return False, "Please provide at least first name and paternal surname"
-        elif context["name_format"] == "family_first":
-            if len(name_parts) < 2:
-                return False, "Please provide both family and given name"
-        elif context["name_format"] == "first_patronymic_last":
-            if len(name_parts) < 2:
-                return False, "Please provide at least first and last name"
+        min_parts, error_message = self._NAME_FORMAT_RULES.get(context["name_format"], (0, ""))
+        if len(name_parts) < min_parts:
+            return False, error_message
         
         return True, ""
     
-    def _validate_phone_format(self, phone: str, context: Dict) -> Tuple[bool, str]:
+    def _validate_phone_format(self, phone: str, context: Mapping[str, Any]) -> Tuple[bool, str]:
         """Validate phone format based on cultural context."""
         if not phone or not phone.strip():
             return False, "Phone number cannot be empty"
         
         # Basic validation - contains digits and common phone characters
-        phone_clean = re.sub(r'[^\d+\-\s\(\)]', '', phone)
+        phone_clean = _PHONE_STRIP_RE.sub('', phone)
         if len(phone_clean) < 7:
             return False, f"Phone number seems too short. Expected format: {context['phone_format']}"
         
         return True, ""
     
-    def _validate_date_format(self, date: str, context: Dict) -> Tuple[bool, str]:
+    def _validate_date_format(self, date: str, context: Mapping[str, Any]) -> Tuple[bool, str]:
         """Validate date format based on cultural context."""
         if not date or not date.strip():
             return False, "Date cannot be empty"
         
         # Basic date validation
-        date_patterns = {
-            "DD/MM/YYYY": r'\d{1,2}/\d{1,2}/\d{4}',
-            "MM/DD/YYYY": r'\d{1,2}/\d{1,2}/\d{4}',
-            "YYYY/MM/DD": r'\d{4}/\d{1,2}/\d{1,2}',
-            "DD.MM.YYYY": r'\d{1,2}\.\d{1,2}\.\d{4}',
-            "YYYY.MM.DD": r'\d{4}\.\d{1,2}\.\d{1,2}'
-        }
-        
         expected_format = context["date_format"]
-        pattern = date_patterns.get(expected_format, r'\d{1,2}[/\-.]\d{1,2}[/\-.]\d{4}')
+        pattern = _DATE_PATTERNS.get(expected_format, _DEFAULT_DATE_PATTERN)
         
-        if not re.match(pattern, date.strip()):
+        if not pattern.match(date.strip()):
             return False, f"Date format should be {expected_format}"
         
-        return True, "" 
\ No newline at end of file
+        return True, ""
+    
+    # Validators per cultural data type, called with (self, value, context)
+    _VALIDATORS = {
+        "name": _validate_name_format,
+        "phone": _validate_phone_format,
+        "date": _validate_date_format
+    }
\ No newline at end of file
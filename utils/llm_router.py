@@ -14,6 +14,9 @@ import config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class FallbackResponse(str):
+    """A static reply returned when every API provider failed."""
+
 class LLMRouter:
     """Routes LLM requests to Groq (primary) and OpenRouter (fallback, best 2025 models)."""
     def __init__(self):
@@ -47,14 +50,14 @@ class LLMRouter:
         if not self.groq_client and not self.openrouter_client:
             logger.warning("No API keys provided. LLM functionality will be limited.")
 
-    def _call_groq(self, prompt: str, temperature: float = 0.7, max_tokens: int = 500) -> Optional[str]:
-        """Call the Groq API and return the response using the best free model."""
+    def _call_groq(self, prompt: str, temperature: float = 0.7, max_tokens: int = 500, model: Optional[str] = None) -> Optional[str]:
+        """Call the Groq API and return the response using the given model (defaults to config.GROQ_MODEL)."""
         if not self.groq_client:
             logger.warning("Groq API key not provided or client not initialized.")
             return None
         try:
             response = self.groq_client.chat.completions.create(
-                model=config.GROQ_MODEL,
+                model=model or config.GROQ_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=temperature,
                 max_tokens=max_tokens
@@ -106,9 +109,9 @@ class LLMRouter:
         logger.error("❌ All OpenRouter fallback models failed.")
         return None
 
-    def get_response(self, prompt: str, use_case: str = "general", temperature: float = 0.7, max_tokens: int = 500) -> str:
+    def get_response(self, prompt: str, use_case: str = "general", temperature: float = 0.7, max_tokens: int = 500, model: Optional[str] = None) -> str:
         """
-        Get a response from Groq LLM (llama3-8b-8192). If unavailable, fallback to OpenRouter best 2025 models. If all fail, return a user-friendly fallback.
+        Get a response from Groq LLM (config.GROQ_MODEL unless a model is given). If unavailable, fallback to OpenRouter best 2025 models. If all fail, return a user-friendly fallback.
         """
         # Determine which service to try first based on availability
         primary_service = "groq" if self.groq_client else "openrouter" if self.openrouter_client else None
@@ -116,7 +119,7 @@ class LLMRouter:
         if primary_service == "groq":
             # Try Groq first
             logger.info("🚀 Attempting Groq API call...")
-            response = self._call_groq(prompt, temperature, max_tokens)
+            response = self._call_groq(prompt, temperature, max_tokens, model)
             if response:
                 logger.info("✅ Groq API call successful")
                 return response
@@ -140,6 +143,18 @@ class LLMRouter:
         logger.warning("❌ All API services failed, using static fallback")
         return self._get_fallback_response(use_case)
 
+    def is_fallback(self, response: str) -> bool:
+        """
+        Check whether a response is a static fallback rather than a model reply.
+        
+        Args:
+            response: Response returned by get_response or get_multilingual_response
+            
+        Returns:
+            True if every API provider failed and a static fallback was returned
+        """
+        return isinstance(response, FallbackResponse)
+
     def _get_fallback_response(self, use_case: str) -> str:
         """Get a fallback response when all APIs fail."""
         fallback_responses = {
@@ -155,7 +170,7 @@ class LLMRouter:
             "general": "I apologize, but I'm having trouble connecting to my knowledge base. Could you please try again in a moment?"
         }
 
-        return fallback_responses.get(use_case, fallback_responses["general"])
+        return FallbackResponse(fallback_responses.get(use_case, fallback_responses["general"]))
 
     def generate_technical_questions(self, tech_stack: List[str], experience_years: int) -> List[str]:
         """
@@ -217,7 +232,7 @@ class LLMRouter:
                 f"Could you describe your experience with {tech}?" for tech in tech_stack[:config.MIN_TECHNICAL_QUESTIONS]
             ]
     
-    def get_multilingual_response(self, prompt: str, language: str, context: Dict = None, use_case: str = "general", temperature: float = 0.7, max_tokens: int = 500) -> str:
+    def get_multilingual_response(self, prompt: str, language: str, context: Dict = None, use_case: str = "general", temperature: float = 0.7, max_tokens: int = 500, model: Optional[str] = None) -> str:
         """
         Get a response from LLM with language-specific handling.
         
@@ -228,19 +243,20 @@ class LLMRouter:
             use_case: Use case for fallback responses
             temperature: Temperature for response generation
             max_tokens: Maximum tokens in response
+            model: Optional Groq model override (defaults to config.GROQ_MODEL)
             
         Returns:
             Response in the target language
         """
         if language == "en":
             # For English, use the standard method
-            return self.get_response(prompt, use_case, temperature, max_tokens)
+            return self.get_response(prompt, use_case, temperature, max_tokens, model)
         
         # For non-English languages, add translation instructions
         multilingual_prompt = self.translate_prompt(prompt, language, context)
         
         # Try to get response
-        response = self._call_groq(multilingual_prompt, temperature, max_tokens)
+        response = self._call_groq(multilingual_prompt, temperature, max_tokens, model)
         if response:
             return response
         
@@ -479,7 +495,7 @@ Previous conversation context: {history_summary}
         
         # Get fallback for the language, or use English as ultimate fallback
         language_fallbacks = localized_fallbacks.get(language, localized_fallbacks["en"])
-        return language_fallbacks.get(use_case, language_fallbacks.get("general", "I apologize for the technical difficulty. Please try again."))
+        return FallbackResponse(language_fallbacks.get(use_case, language_fallbacks.get("general", "I apologize for the technical difficulty. Please try again.")))
     
     def _summarize_conversation_history(self, history: List[Dict]) -> str:
         """
@@ -27,6 +27,8 @@ class PerformanceManager:
         self.cache_size = cache_size
         self.cache_ttl = cache_ttl
         self.response_cache = OrderedDict()
+        # Guards response_cache; the manager is shared across sessions and threads
+        self._cache_lock = threading.Lock()
         self.request_queue = []
         self.processing_threads = []
         self.max_concurrent_requests = 5
@@ -46,7 +48,7 @@ class PerformanceManager:
         self.cleanup_thread = threading.Thread(target=self._cleanup_cache, daemon=True)
         self.cleanup_thread.start()
     
-    def get_cached_response(self, key: str) -> Optional[str]:
+    def get_cached_response(self, key: str) -> Optional[Any]:
         """
         Get a cached response if available and not expired.
         
@@ -54,41 +56,43 @@ class PerformanceManager:
             key: Cache key
             
         Returns:
-            Cached response or None if not found/expired
+            Cached response (string or any cached object) or None if not found/expired
         """
-        if key in self.response_cache:
-            cached_item = self.response_cache[key]
+        with self._cache_lock:
+            cached_item = self.response_cache.get(key)
+            if cached_item is not None:
+                # Check if cache item is expired
+                if time.time() - cached_item["timestamp"] < self.cache_ttl:
+                    # Move to end (most recently used)
+                    self.response_cache.move_to_end(key)
+                    self.metrics["cache_hits"] += 1
+                    return cached_item["response"]
+                else:
+                    # Remove expired item
+                    del self.response_cache[key]
             
-            # Check if cache item is expired
-            if time.time() - cached_item["timestamp"] < self.cache_ttl:
-                # Move to end (most recently used)
-                self.response_cache.move_to_end(key)
-                self.metrics["cache_hits"] += 1
-                return cached_item["response"]
-            else:
-                # Remove expired item
-                del self.response_cache[key]
-        
-        self.metrics["cache_misses"] += 1
-        return None
+            self.metrics["cache_misses"] += 1
+            return None
     
-    def cache_response(self, key: str, response: str) -> None:
+    def cache_response(self, key: str, response: Any) -> None:
         """
         Cache a response with timestamp.
         
         Args:
             key: Cache key
-            response: Response to cache
+            response: Response to cache; any object is stored as-is without serialization
         """
-        # Remove oldest item if cache is full
-        if len(self.response_cache) >= self.cache_size:
-            self.response_cache.popitem(last=False)
-        
-        # Add new item
-        self.response_cache[key] = {
-            "response": response,
-            "timestamp": time.time()
-        }
+        with self._cache_lock:
+            # Remove oldest item if cache is full
+            if key not in self.response_cache and len(self.response_cache) >= self.cache_size:
+                self.response_cache.popitem(last=False)
+            
+            # Add new item
+            self.response_cache[key] = {
+                "response": response,
+                "timestamp": time.time()
+            }
+            self.response_cache.move_to_end(key)
     
     def generate_cache_key(self, prompt: str, user_context: Dict) -> str:
         """
@@ -195,14 +199,15 @@ class PerformanceManager:
         while True:
             try:
                 current_time = time.time()
-                expired_keys = []
-                
-                for key, item in self.response_cache.items():
-                    if current_time - item["timestamp"] >= self.cache_ttl:
-                        expired_keys.append(key)
                 
-                for key in expired_keys:
-                    del self.response_cache[key]
+                with self._cache_lock:
+                    expired_keys = [
+                        key for key, item in self.response_cache.items()
+                        if current_time - item["timestamp"] >= self.cache_ttl
+                    ]
+                    
+                    for key in expired_keys:
+                        del self.response_cache[key]
                 
                 # Sleep for 5 minutes before next cleanup
                 time.sleep(300)
@@ -352,7 +357,8 @@ class PerformanceManager:
     
     def clear_cache(self) -> None:
         """Clear all cached responses."""
-        self.response_cache.clear()
+        with self._cache_lock:
+            self.response_cache.clear()
     
     def get_cache_stats(self) -> Dict:
         """
@@ -361,9 +367,9 @@ class PerformanceManager:
         Returns:
             Cache statistics dictionary
         """
-        cache_ages = []
-        for item in self.response_cache.values():
-            cache_ages.append(time.time() - item["timestamp"])
+        now = time.time()
+        with self._cache_lock:
+            cache_ages = [now - item["timestamp"] for item in self.response_cache.values()]
         
         return {
             "total_items": len(self.response_cache),
@@ -5,6 +5,7 @@ Handles user preferences, history tracking, and personalized responses.
 """
 import json
 import os
+import threading
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import hashlib
@@ -26,6 +27,9 @@ class PersonalizationManager:
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
         
+        # Guards the profile and history dicts and their files; the manager is shared across sessions and threads
+        self._lock = threading.RLock()
+        
         # Load existing data
         self.user_profiles = self._load_user_profiles()
         self.interaction_history = self._load_interaction_history()
@@ -43,7 +47,7 @@ class PersonalizationManager:
     def _save_user_profiles(self) -> None:
         """Save user profiles to file."""
         try:
-            with open(self.user_profiles_file, 'w', encoding='utf-8') as f:
+            with self._lock, open(self.user_profiles_file, 'w', encoding='utf-8') as f:
                 json.dump(self.user_profiles, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Error saving user profiles: {e}")
@@ -61,7 +65,7 @@ class PersonalizationManager:
     def _save_interaction_history(self) -> None:
         """Save interaction history to file."""
         try:
-            with open(self.interaction_history_file, 'w', encoding='utf-8') as f:
+            with self._lock, open(self.interaction_history_file, 'w', encoding='utf-8') as f:
                 json.dump(self.interaction_history, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Error saving interaction history: {e}")
@@ -120,12 +124,13 @@ class PersonalizationManager:
             user_id: User identifier
             updates: Dictionary of updates to apply
         """
-        profile = self.get_user_profile(user_id)
-        profile.update(updates)
-        profile["last_interaction"] = datetime.now().isoformat()
-        
-        self.user_profiles[user_id] = profile
-        self._save_user_profiles()
+        with self._lock:
+            profile = self.get_user_profile(user_id)
+            profile.update(updates)
+            profile["last_interaction"] = datetime.now().isoformat()
+            
+            self.user_profiles[user_id] = profile
+            self._save_user_profiles()
     
     def record_interaction(self, user_id: str, interaction_data: Dict) -> None:
         """
@@ -135,23 +140,24 @@ class PersonalizationManager:
             user_id: User identifier
             interaction_data: Interaction details
         """
-        if user_id not in self.interaction_history:
-            self.interaction_history[user_id] = []
-        
-        interaction_data["timestamp"] = datetime.now().isoformat()
-        self.interaction_history[user_id].append(interaction_data)
-        
-        # Keep only last 50 interactions per user
-        if len(self.interaction_history[user_id]) > 50:
-            self.interaction_history[user_id] = self.interaction_history[user_id][-50:]
-        
-        self._save_interaction_history()
-        
-        # Update user profile
-        profile = self.get_user_profile(user_id)
-        profile["interaction_count"] += 1
-        profile["last_interaction"] = datetime.now().isoformat()
-        self.update_user_profile(user_id, profile)
+        with self._lock:
+            if user_id not in self.interaction_history:
+                self.interaction_history[user_id] = []
+            
+            interaction_data["timestamp"] = datetime.now().isoformat()
+            self.interaction_history[user_id].append(interaction_data)
+            
+            # Keep only last 50 interactions per user
+            if len(self.interaction_history[user_id]) > 50:
+                self.interaction_history[user_id] = self.interaction_history[user_id][-50:]
+            
+            self._save_interaction_history()
+            
+            # Update user profile
+            profile = self.get_user_profile(user_id)
+            profile["interaction_count"] += 1
+            profile["last_interaction"] = datetime.now().isoformat()
+            self.update_user_profile(user_id, profile)
     
     def get_personalized_greeting(self, user_id: str, language_code: str = "en") -> str:
         """
@@ -335,9 +341,10 @@ class PersonalizationManager:
             user_id: User identifier
             preferences: New preferences
         """
-        profile = self.get_user_profile(user_id)
-        profile["preferences"].update(preferences)
-        self.update_user_profile(user_id, profile)
+        with self._lock:
+            profile = self.get_user_profile(user_id)
+            profile["preferences"].update(preferences)
+            self.update_user_profile(user_id, profile)
     
     def get_user_statistics(self, user_id: str) -> Dict:
         """
@@ -384,18 +391,19 @@ class PersonalizationManager:
             rating: Rating (1-5)
             feedback: Optional feedback text
         """
-        profile = self.get_user_profile(user_id)
-        
-        if "feedback_ratings" not in profile:
-            profile["feedback_ratings"] = []
-        
-        profile["feedback_ratings"].append({
-            "rating": rating,
-            "feedback": feedback,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        self.update_user_profile(user_id, profile)
+        with self._lock:
+            profile = self.get_user_profile(user_id)
+            
+            if "feedback_ratings" not in profile:
+                profile["feedback_ratings"] = []
+            
+            profile["feedback_ratings"].append({
+                "rating": rating,
+                "feedback": feedback,
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            self.update_user_profile(user_id, profile)
     
     def get_recommendations(self, user_id: str) -> List[str]:
         """
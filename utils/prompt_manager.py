@@ -1,9 +1,21 @@
 """Manages prompt templates and instructions for the TalentScout Hiring Assistant."""
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 class PromptManager:
     """Manages prompt templates for the TalentScout Hiring Assistant."""
     
+    # Canned English replies for deterministic stage transitions (completed stage -> next stage)
+    TRANSITION_TEMPLATES = {
+        "name->contact_info": "Nice to meet you, {name}! Could you please share your email address and phone number (including country code)?",
+        "contact_info->experience": "Thanks {name}! Now, how many years of professional experience do you have in the tech industry?",
+        "experience->position": "Great, {years_experience} years of experience noted. What position or role are you interested in?",
+        "position->location": "{position} - got it! Where are you currently located (City, Country)?",
+        "location->tech_stack": (
+            "Thanks, {name}! Now let's talk about your technical skills. Please list the programming languages, "
+            "frameworks, databases and tools you're proficient in."
+        ),
+    }
+    
     def __init__(self):
         """Initialize prompt templates."""
         self.templates = {
@@ -39,6 +51,26 @@ class PromptManager:
             print(f"Missing key in prompt formatting: {e}")
             return self.templates["fallback"]
     
+    def get_transition_message(self, transition: str, **kwargs) -> Optional[str]:
+        """
+        Get a canned transition reply that needs no LLM call.
+        
+        Args:
+            transition: Transition key such as "contact_info->experience"
+            **kwargs: Candidate fields to format the reply with
+            
+        Returns:
+            Formatted reply, or None if no template applies
+        """
+        template = self.TRANSITION_TEMPLATES.get(transition)
+        if not template:
+            return None
+            
+        try:
+            return template.format(**kwargs)
+        except KeyError:
+            return None
+    
     def _greeting_template(self) -> str:
         """Greeting prompt: clear, friendly, and explicit about the bot's role. Instructs LLM to avoid hallucination."""
         return (